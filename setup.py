@@ -1,5 +1,4 @@
 import os
-import sys
 
 import setuptools
 import setuptools.command.build_py as orig
@@ -8,9 +7,9 @@ import setuptools.command.build_py as orig
 try:
     from Cython.Build import cythonize
 except ImportError:
-    print("You don't seem to have Cython installed. Please get a")
-    print("copy from www.cython.org and install it")
-    sys.exit(1)
+    print("You don't seem to have Cython installed, installing the pure Python modules.")
+    print("Get a copy from www.cython.org and reinstall to compile them")
+    cythonize = None
 
 
 def get_extension_paths(root_dir):
@@ -50,7 +49,15 @@ if __name__ == "__main__":
         ],
         install_requires=["pygame"],
         python_requires=">=3.8",
-        ext_modules=cythonize(get_extension_paths("src"), ["src/pynes/*.py"], language_level="3"),
+        ext_modules=cythonize(
+            get_extension_paths("src"),
+            ["src/pynes/*.py"],
+            language_level="3",
+            compiler_directives={
+                "boundscheck": False,
+                "wraparound": False,
+            }
+        ) if cythonize is not None else [],
         cmdclass={
             "build_py": build_py
         }
@@ -1,12 +1,12 @@
+import time
 import pygame as pg
 
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Dict, List, Optional, Tuple
 from pygame.locals import *
 
 from nes.bus import Bus
 from nes.cartridge import Cartridge
-from nes.cpu import CPU
 
 
 def load_font(file: str, size: int) -> pg.font.Font:
@@ -31,12 +31,14 @@ def load_image(file: str) -> pg.Surface:
         raise SystemExit(f"Could not load image '{file}' {pg.get_error()}")
 
 
-def scale_surface(src: pg.Surface, factor: int) -> pg.Surface:
+def scale_surface(src: pg.Surface, factor: int, dest: Optional[pg.Surface] = None) -> pg.Surface:
     """
-    Loads an image, prepares it for play.
+    Scales a surface by the given factor, optionally into a preallocated surface.
     """
     new_size: Tuple[int, int] = (src.get_width() * factor, src.get_height() * factor)
-    return pg.transform.scale(src, new_size)
+    if dest is None:
+        return pg.transform.scale(src, new_size)
+    return pg.transform.scale(src, new_size, dest)
 
 
 class TextPrint:
@@ -77,6 +79,16 @@ class NESEmulator:
     WIN_SIZE: Tuple[int, int] = (681, 522)
     DEBUG_WIN_SIZE: Tuple[int, int] = (1000, 522)
 
+    # Request a true-color window whatever the desktop default, blits of the paletted NES screen
+    # still look each pixel up in its palette:
+    WIN_DEPTH: int = 32
+
+    CPU_RECT: pg.Rect = pg.Rect(690, 0, 269, 160)
+    CODE_RECT: pg.Rect = pg.Rect(690, 160, 269, 372)
+
+    # Duration of one NTSC frame in seconds:
+    FRAME_PERIOD: float = 1 / 60.0988
+
     def __init__(self) -> None:
         pg.init()
         pg.display.init()
@@ -89,13 +101,19 @@ class NESEmulator:
         self.code: Dict[int, str] = {}
         self.text_printer: TextPrint = TextPrint("CascadiaMono.ttf", 22)
 
-        self.screen: pg.Surface = pg.display.set_mode(self.get_window_size())
+        self.screen: pg.Surface = pg.display.set_mode(self.get_window_size(), 0, self.WIN_DEPTH)
+        pg.display.flip()
         self.clock: pg.time.Clock = pg.time.Clock()
 
+        # Scale the NES screen into a reusable surface:
+        self.nes_screen: pg.Surface = scale_surface(self.nes.ppu.screen, 2)
+
         pg.display.set_icon(load_image("nes.png"))
         pg.display.set_caption("NES emulator")
         pg.mouse.set_visible(False)
 
+        # Queue only the events that are handled:
+        pg.event.set_blocked(None)
         pg.event.set_allowed([KEYDOWN, QUIT])
         pg.key.set_repeat(400, 200)
 
@@ -114,56 +132,28 @@ class NESEmulator:
         """
         Runs the main loop of the emulator.
         """
-        while self.running:
-            for ev in pg.event.get():
-                if ev.type == QUIT or ev.type == KEYDOWN and ev.key == K_ESCAPE:
-                    # Exit the main loop:
-                    self.running = False
-
-                elif ev.type == KEYDOWN and ev.key == K_F1:
-                    # Toggle emulation debug mode:
-                    self.debug_mode ^= True
-                    self.screen = pg.display.set_mode(self.get_window_size())
-
-                elif self.debug_mode:
-                    if ev.type == KEYDOWN and ev.key == K_c:
-                        # Emulate code step-by-step:
-                        while True:
-                            self.nes.clock()
-                            if self.nes.cpu.instruction_completed():
-                                break
-
-                        # Drain additional system clock cycles out:
-                        while True:
-                            self.nes.clock()
-                            if not self.nes.cpu.instruction_completed():
-                                break
-
-                    elif ev.type == KEYDOWN and ev.key == K_f:
-                        # Emulate one frame:
-                        while True:
-                            self.nes.clock()
-                            if self.nes.ppu.frame_completed() and self.nes.cpu.instruction_completed():
-                                break
+        frame_deadline: float = time.perf_counter()
 
+        while self.running:
             # Run emulation:
-            while not self.debug_mode:
-                self.nes.clock()
-                if self.nes.ppu.frame_completed():
-                    break
+            if not self.debug_mode:
+                self.nes.run_frame()
 
             # Draw NES screen:
-            self.screen.blit(scale_surface(self.nes.ppu.screen, 2), (0, 0))
+            dirty_rects: List[pg.Rect] = [self.screen.blit(scale_surface(self.nes.ppu.screen, 2, self.nes_screen), (0, 0))]
 
             if self.debug_mode:
                 # Draw additional debug components:
-                self.draw_cpu(pg.Rect(690, 0, 269, 160))
-                self.draw_code(pg.Rect(690, 160, 269, 372))
+                self.draw_cpu(self.CPU_RECT)
+                self.draw_code(self.CODE_RECT)
+                dirty_rects += [self.CPU_RECT, self.CODE_RECT]
 
-            pg.display.flip()
+            # Update only the parts of the window that were redrawn:
+            pg.display.update(dirty_rects)
 
-            # Cap the frame rate at 60 fps:
-            self.clock.tick(60)
+            # Pace the emulation at the NES frame rate:
+            frame_deadline = self.wait_frame(frame_deadline + self.FRAME_PERIOD)
+            self.clock.tick()
 
             # Update window caption:
             pg.display.set_caption(f"NES emulator - FPS: {int(self.clock.get_fps())}")
@@ -171,6 +161,60 @@ class NESEmulator:
         # Quit the program:
         pg.quit()
 
+    def handle_events(self) -> None:
+        """
+        Processes pending window and keyboard events.
+        """
+        for ev in pg.event.get():
+            if ev.type == QUIT or ev.type == KEYDOWN and ev.key == K_ESCAPE:
+                # Exit the main loop:
+                self.running = False
+
+            elif ev.type == KEYDOWN and ev.key == K_F1:
+                # Toggle emulation debug mode:
+                self.debug_mode ^= True
+                self.screen = pg.display.set_mode(self.get_window_size(), 0, self.WIN_DEPTH)
+                pg.display.flip()
+
+            elif self.debug_mode:
+                if ev.type == KEYDOWN and ev.key == K_c:
+                    # Emulate code step-by-step:
+                    while True:
+                        self.nes.clock()
+                        if self.nes.cpu.instruction_completed():
+                            break
+
+                    # Drain additional system clock cycles out:
+                    while True:
+                        self.nes.clock()
+                        if not self.nes.cpu.instruction_completed():
+                            break
+
+                elif ev.type == KEYDOWN and ev.key == K_f:
+                    # Emulate one frame:
+                    while True:
+                        self.nes.clock()
+                        if self.nes.ppu.frame_completed() and self.nes.cpu.instruction_completed():
+                            break
+
+    def wait_frame(self, deadline: float) -> float:
+        """
+        Handles input until the frame deadline and returns the time the next frame is counted from.
+        """
+        while self.running:
+            self.handle_events()
+            now: float = time.perf_counter()
+
+            # Resynchronize instead of rushing through the missed frames:
+            if now >= deadline:
+                return now if now - deadline > self.FRAME_PERIOD else deadline
+
+            # Sleep in short slices, spinning through the last one for precision:
+            if deadline - now > 0.002:
+                time.sleep(0.001)
+
+        return deadline
+
     def draw_cpu(self, rect: pg.Rect) -> None:
         """
         Draws content of the CPU internal registers.
@@ -185,9 +229,9 @@ class NESEmulator:
         self.text_printer.print(self.screen, "STATUS: ", new_line=False)
 
         # Print status register flags:
-        for flag in CPU.FLAGS:
-            color = pg.Color("white" if self.nes.cpu.status_reg & flag.value else "gray20")
-            self.text_printer.print(self.screen, f"{flag.name} ", color, False)
+        for bit, name in enumerate("CZIDBUVN"):
+            color = pg.Color("white" if self.nes.cpu.status_reg & (1 << bit) else "gray20")
+            self.text_printer.print(self.screen, f"{name} ", color, False)
 
         # Print rest of registers:
         self.text_printer.print(self.screen, f"A: ${format(self.nes.cpu.a_reg, '02x')}")
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from __future__ import annotations
+
+from typing import Callable, Optional
 from .cartridge import Cartridge
 
 
@@ -7,7 +9,8 @@ class Bus:
     NES - System Bus.
     """
 
-    __slots__ = ("cpu", "ppu", "ram", "cart", "_system_clock_count")
+    __slots__ = ("cpu", "ppu", "ram", "cart", "_clock_phase",
+                 "_cpu_clock", "_ppu_clock", "_ppu_read", "_ppu_write")
 
     def __init__(self) -> None:
         from .cpu import CPU
@@ -16,11 +19,17 @@ class Bus:
         # Devices on the bus:
         self.cpu: CPU = CPU()
         self.ppu: PPU = PPU()
-        self.ram: List[int] = [0x00] * 2048
+        self.ram: bytearray = bytearray(2048)
         self.cart: Optional[Cartridge] = None
 
-        # Helper variable:
-        self._system_clock_count: int = 0
+        # Position within the 3 PPU cycles of one CPU cycle:
+        self._clock_phase: int = 0
+
+        # Bound methods of the devices used on every cycle:
+        self._cpu_clock: Callable[[], None] = self.cpu.clock
+        self._ppu_clock: Callable[[], None] = self.ppu.clock
+        self._ppu_read: Callable[[int, bool], int] = self.ppu.read
+        self._ppu_write: Callable[[int, int], None] = self.ppu.write
 
         # Connect bus to the CPU:
         self.cpu.connect_bus(self)
@@ -38,45 +47,80 @@ class Bus:
         """
         self.cpu.reset()
         self.ppu.reset()
-        self._system_clock_count = 0
+        self._clock_phase = 0
 
     def clock(self) -> None:
         """
         Performs one clock cycle's worth of update.
         """
-        self.ppu.clock()
+        self._ppu_clock()
         # The CPU runs 3 times slower than the PPU:
-        if self._system_clock_count % 3 == 0:
-            self.cpu.clock()
-        self._system_clock_count += 1
+        if self._clock_phase == 0:
+            self._cpu_clock()
+        self._clock_phase = 0 if self._clock_phase == 2 else self._clock_phase + 1
+
+    def run_frame(self) -> None:
+        """
+        Performs clock cycles until the PPU completes the current frame.
+        """
+        ppu_cycles: int = self.ppu.cycles_to_frame_complete()
+
+        # The CPU runs 3 times slower than the PPU, on the cycles of phase 0:
+        cpu_cycles: int = (ppu_cycles + 2 - (3 - self._clock_phase) % 3) // 3
+        self._clock_phase = (self._clock_phase + ppu_cycles) % 3
+
+        # Each device runs the frame in one batch, which is only correct while the PPU never raises an NMI
+        # and its status register ($2002) does not change within a frame (see tests/test_bus.py):
+        self.cpu.run(cpu_cycles)
+        self.ppu.run(ppu_cycles)
 
     def write(self, address: int, data: int) -> None:
         """
         Writes a byte to the main bus at the specified address.
         """
-        # System RAM address range - mirrored every 2 kilobytes:
-        if 0x0000 <= address <= 0x1FFF:
+        # System RAM address range (0x0000-0x1FFF) - mirrored every 2 kilobytes:
+        if address < 0x2000:
             self.ram[address & 0x07FF] = data
 
-        # PPU address range - mirrored every 1 byte:
-        elif 0x2000 <= address <= 0x3FFF:
-            self.ppu.write(address & 0x0007, data)
+        # PPU address range (0x2000-0x3FFF) - mirrored every 1 byte:
+        elif address < 0x4000:
+            self._ppu_write(address & 0x0007, data)
 
         # Cartridge address range:
-        elif self.cart:
-            self.cart.write(address, data)
+        else:
+            cart: Optional[Cartridge] = self.cart
+            if cart is not None:
+                cart.write(address, data)
         
     def read(self, address: int, read_only: bool = False) -> int:
         """
         Reads a byte from the main bus at the specified address.
         """
-        # System RAM address range - mirrored every 2 kilobytes:
-        if 0x0000 <= address <= 0x1FFF:
+        # System RAM address range (0x0000-0x1FFF) - mirrored every 2 kilobytes:
+        if address < 0x2000:
             return self.ram[address & 0x07FF]
 
-        # PPU address range - mirrored every 1 byte:
-        if 0x2000 <= address <= 0x3FFF:
-            return self.ppu.read(address & 0x0007, read_only)
+        # PPU address range (0x2000-0x3FFF) - mirrored every 1 byte:
+        if address < 0x4000:
+            return self._ppu_read(address & 0x0007, read_only)
 
         # Cartridge address range:
-        return self.cart.read(address) if self.cart else 0x00
+        cart: Optional[Cartridge] = self.cart
+        return cart.read(address) if cart is not None else 0x00
+
+    def read16(self, address: int) -> int:
+        """
+        Reads a little-endian 16-bit word from the main bus at the specified address.
+        """
+        # Both bytes in the system RAM address range:
+        if address < 0x1FFF:
+            ram: bytearray = self.ram
+            return ram[address & 0x07FF] | (ram[(address + 1) & 0x07FF] << 8)
+
+        # Both bytes in the cartridge address range:
+        if address >= 0x4000:
+            cart: Optional[Cartridge] = self.cart
+            return cart.read(address) | (cart.read(address + 1) << 8) if cart is not None else 0x0000
+
+        # The word spans devices or PPU registers with read side effects:
+        return self.read(address) | (self.read(address + 1) << 8)
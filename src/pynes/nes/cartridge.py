@@ -1,9 +1,14 @@
-from enum import Enum
-from typing import Dict, List, Optional, Type
+from __future__ import annotations
+
+from typing import Optional, Tuple, Type
 
 from .mappers.mapper import Mapper
 from .mappers.mapper_000 import Mapper000
 
+# Nametable mirroring modes:
+MIRROR_HORIZONTAL: int = 0
+MIRROR_VERTICAL: int = 1
+
 
 class Cartridge:
     """
@@ -12,38 +17,39 @@ class Cartridge:
 
     __slots__ = ("file_path", "prg_banks", "chr_banks", "prg_memory", "chr_memory", "mapper", "mirror", "valid_image")
 
-    mappers: Dict[int, Type[Mapper]] = {
-        0: Mapper000,
-    }
-
-    class MIRROR(Enum):
-        HORIZONTAL = 0
-        VERTICAL = 1
+    # Supported mappers indexed by the 8-bit mapper ID:
+    mappers: Tuple[Optional[Type[Mapper]], ...] = (Mapper000,) + 255 * (None,)
 
     def __init__(self, file_path: str) -> None:
         self.file_path: str = file_path
 
         self.prg_banks: int = 0
         self.chr_banks: int = 0
-        self.prg_memory: List[int] = []
-        self.chr_memory: List[int] = []
+        self.prg_memory: bytearray = bytearray()
+        self.chr_memory: bytearray = bytearray()
 
         self.mapper: Optional[Mapper] = None
-        self.mirror: Cartridge.MIRROR = Cartridge.MIRROR.HORIZONTAL
+        self.mirror: int = MIRROR_HORIZONTAL
         self.valid_image: bool = False
 
         try:
             with open(self.file_path, "rb") as f:
                 # Read header - size 16B:
-                name: bytes = f.read(4)
-                prg_rom_chunks: int = int.from_bytes(f.read(1), "little")
-                chr_rom_chunks: int = int.from_bytes(f.read(1), "little")
-                mapper_1: int = int.from_bytes(f.read(1), "little")
-                mapper_2: int = int.from_bytes(f.read(1), "little")
-                prg_ram_size: bytes = f.read(1)
-                tv_system_1: bytes = f.read(1)
-                tv_system_2: bytes = f.read(1)
-                unused: bytes = f.read(5)
+                header: bytes = f.read(16)
+
+                # Leave the image invalid if the header is truncated or not an iNES one:
+                if len(header) < 16 or header[0:4] != b"NES\x1a":
+                    return
+
+                name: bytes = header[0:4]
+                prg_rom_chunks: int = header[4]
+                chr_rom_chunks: int = header[5]
+                mapper_1: int = header[6]
+                mapper_2: int = header[7]
+                prg_ram_size: int = header[8]
+                tv_system_1: int = header[9]
+                tv_system_2: int = header[10]
+                unused: bytes = header[11:16]
 
                 # Skip trainer:
                 if mapper_1 & 0x04:
@@ -51,16 +57,20 @@ class Cartridge:
 
                 # Get program and character memory:
                 self.prg_banks = prg_rom_chunks
-                self.prg_memory = list(f.read(self.prg_banks * 16384))
+                self.prg_memory = bytearray(self.prg_banks * 16384)
+                f.readinto(self.prg_memory)
                 self.chr_banks = chr_rom_chunks
-                self.chr_memory = list(f.read(self.chr_banks * 8192))
+                self.chr_memory = bytearray(self.chr_banks * 8192)
+                f.readinto(self.chr_memory)
 
                 # Load appropriate mapper:
-                mapper_id: int = ((mapper_2 >> 4) << 4) | (mapper_1 >> 4)
-                self.mapper = self.mappers[mapper_id](self.prg_banks, self.chr_banks)
+                mapper_id: int = (mapper_2 & 0xF0) | (mapper_1 >> 4)
+                mapper: Optional[Type[Mapper]] = self.mappers[mapper_id]
+                if mapper:
+                    self.mapper = mapper(self.prg_banks, self.chr_banks)
 
-                self.mirror = Cartridge.MIRROR.VERTICAL if mapper_1 & 0x01 else Cartridge.MIRROR.HORIZONTAL
-                self.valid_image = True
+                self.mirror = MIRROR_VERTICAL if mapper_1 & 0x01 else MIRROR_HORIZONTAL
+                self.valid_image = self.mapper is not None
 
         except OSError:
             pass
@@ -72,22 +82,18 @@ class Cartridge:
         return self.mapper.map_write(address) != -0x0001
 
     def read(self, address: int) -> int:
-        if self.mapper:
-            mapped_address = self.mapper.map_read(address)
+        mapper: Optional[Mapper] = self.mapper
+        if mapper is not None:
+            mapped_address = mapper.map_read(address)
             if mapped_address != -0x0001:
-                if 0x0000 <= address <= 0x1FFF:
-                    return self.chr_memory[mapped_address]
-
-                if 0x8000 <= address <= 0xFFFF:
-                    return self.prg_memory[mapped_address]
+                # The mapper only maps character (PPU) or program (CPU) memory ranges:
+                return (self.chr_memory if address < 0x2000 else self.prg_memory)[mapped_address]
         return 0x00
 
     def write(self, address: int, data: int) -> None:
-        if self.mapper:
-            mapped_address = self.mapper.map_write(address)
+        mapper: Optional[Mapper] = self.mapper
+        if mapper is not None:
+            mapped_address = mapper.map_write(address)
             if mapped_address != -0x0001:
-                if 0x0000 <= address <= 0x1FFF:
-                    self.chr_memory[mapped_address] = data
-
-                elif 0x8000 <= address <= 0xFFFF:
-                    self.prg_memory[mapped_address] = data
+                # The mapper only maps character (PPU) or program (CPU) memory ranges:
+                (self.chr_memory if address < 0x2000 else self.prg_memory)[mapped_address] = data
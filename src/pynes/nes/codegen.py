@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from textwrap import dedent, indent
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .cpu import CPU
+
+# Source of the addressing modes. Each one leaves the effective address in `address` and in the CPU,
+# the indexed modes also keep the unindexed address in `base` to detect page crossing:
+ADDRESS_MODES: Dict[str, str] = {
+    "_IMP": "",
+    "_ACC": "",
+    "_IMM": """
+        pc = cpu.pc_reg
+        address = pc
+        cpu.pc_reg = pc + 1
+        cpu._address = address
+    """,
+    "_ZP0": """
+        pc = cpu.pc_reg
+        address = read(pc)
+        cpu.pc_reg = pc + 1
+        cpu._address = address
+    """,
+    "_ZPX": """
+        pc = cpu.pc_reg
+        address = (read(pc) + cpu.x_reg) & 0x00FF
+        cpu.pc_reg = pc + 1
+        cpu._address = address
+    """,
+    "_ZPY": """
+        pc = cpu.pc_reg
+        address = (read(pc) + cpu.y_reg) & 0x00FF
+        cpu.pc_reg = pc + 1
+        cpu._address = address
+    """,
+    "_REL": """
+        pc = cpu.pc_reg + 1
+        address = (((read(pc - 1) ^ 0x80) - 0x80) + pc) & 0xFFFF
+        cpu.pc_reg = pc
+        cpu._address = address
+    """,
+    "_ABS": """
+        pc = cpu.pc_reg
+        address = read16(pc)
+        cpu.pc_reg = pc + 2
+        cpu._address = address
+    """,
+    "_ABX": """
+        pc = cpu.pc_reg
+        base = read16(pc)
+        cpu.pc_reg = pc + 2
+        address = base + cpu.x_reg
+        cpu._address = address
+    """,
+    "_ABY": """
+        pc = cpu.pc_reg
+        base = read16(pc)
+        cpu.pc_reg = pc + 2
+        address = base + cpu.y_reg
+        cpu._address = address
+    """,
+    "_IND": """
+        pc = cpu.pc_reg
+        ptr = read16(pc)
+        cpu.pc_reg = pc + 2
+        address = read(ptr) | (read(ptr & 0xFF00) if (ptr & 0x00FF) == 0x00FF else read(ptr + 1)) << 8
+        cpu._address = address
+    """,
+    "_IZX": """
+        pc = cpu.pc_reg
+        ptr = read(pc) + cpu.x_reg
+        cpu.pc_reg = pc + 1
+        address = ram[ptr & 0x00FF] | (ram[(ptr + 1) & 0x00FF] << 8)
+        cpu._address = address
+    """,
+    "_IZY": """
+        pc = cpu.pc_reg
+        ptr = read(pc)
+        cpu.pc_reg = pc + 1
+        base = ram[ptr] | (ram[(ptr + 1) & 0x00FF] << 8)
+        address = base + cpu.y_reg
+        cpu._address = address
+    """,
+}
+
+# Addressing modes that take an extra cycle when indexing crosses a page:
+PAGE_CROSSING_MODES: Tuple[str, ...] = ("_ABX", "_ABY", "_IZY")
+
+# Source of the comparisons, which differ only in the register compared:
+_COMPARE: str = """
+        m = {load}
+        t = cpu.{register} + 0x0100 - m
+        cpu.status_reg = (cpu.status_reg & {_COMPARE_FLAGS_CLEAR}) | (t >> 8) | _ZN[t & 0x00FF]
+    """
+
+# Source of the operations. The {load} and {store} fields read the operand and write `m` back to it,
+# the status flag fields are the constants of the same name in the cpu module:
+OPERATIONS: Dict[str, str] = {
+    "_ADC": """
+        i = ((cpu.status_reg & {FLAG_C}) << 16) | (cpu.a_reg << 8) | {load}
+        cpu.a_reg = _ADD_RESULT[i]
+        cpu.status_reg = (cpu.status_reg & {_ADD_FLAGS_CLEAR}) | _ADD_FLAGS[i]
+    """,
+    "_AND": """
+        v = cpu.a_reg & {load}
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_ASL_A": """
+        v = cpu.a_reg << 1
+        m = v & 0x00FF
+        cpu.a_reg = m
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v >> 8) | _ZN[m]
+    """,
+    "_ASL_M": """
+        v = {load} << 1
+        m = v & 0x00FF
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v >> 8) | _ZN[m]
+        {store}
+    """,
+    "_BCC": """
+        if not cpu.status_reg & {FLAG_C}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BCS": """
+        if cpu.status_reg & {FLAG_C}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BEQ": """
+        if cpu.status_reg & {FLAG_Z}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BIT": """
+        m = {load}
+        cpu.status_reg = ((cpu.status_reg & {_BIT_FLAGS_CLEAR}) | (m & ({FLAG_V} | {FLAG_N})) |
+                          (_ZN[cpu.a_reg & m] & {FLAG_Z}))
+    """,
+    "_BMI": """
+        if cpu.status_reg & {FLAG_N}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BNE": """
+        if not cpu.status_reg & {FLAG_Z}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BPL": """
+        if not cpu.status_reg & {FLAG_N}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BRK": """
+        pc = cpu.pc_reg + 1
+        sp = cpu.sp_reg
+        ram[0x0100 + sp] = (pc >> 8) & 0x00FF
+        sp = (sp - 1) & 0x00FF
+        ram[0x0100 + sp] = pc & 0x00FF
+        sp = (sp - 1) & 0x00FF
+        cpu.status_reg |= {FLAG_B}
+        ram[0x0100 + sp] = cpu.status_reg
+        cpu.sp_reg = (sp - 1) & 0x00FF
+        cpu.pc_reg = read16(0xFFFE)
+    """,
+    "_BVC": """
+        if not cpu.status_reg & {FLAG_V}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_BVS": """
+        if cpu.status_reg & {FLAG_V}:
+            cpu.pc_reg = address
+            return {cycles} + 1 + (((address ^ pc) >> 8) & 1)
+    """,
+    "_CLC": """
+        cpu.status_reg &= ~{FLAG_C}
+    """,
+    "_CLD": """
+        cpu.status_reg &= ~{FLAG_D}
+    """,
+    "_CLI": """
+        cpu.status_reg &= ~{FLAG_I}
+    """,
+    "_CLV": """
+        cpu.status_reg &= ~{FLAG_V}
+    """,
+    "_CMP": _COMPARE.replace("{register}", "a_reg"),
+    "_CPX": _COMPARE.replace("{register}", "x_reg"),
+    "_CPY": _COMPARE.replace("{register}", "y_reg"),
+    "_DEC": """
+        if address < 0x2000:
+            i = address & 0x07FF
+            m = (ram[i] - 1) & 0x00FF
+            ram[i] = m
+        else:
+            m = ({load} - 1) & 0x00FF
+            {store}
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[m]
+    """,
+    "_DEX": """
+        v = (cpu.x_reg - 1) & 0x00FF
+        cpu.x_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_DEY": """
+        v = (cpu.y_reg - 1) & 0x00FF
+        cpu.y_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_EOR": """
+        v = cpu.a_reg ^ {load}
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_INC": """
+        if address < 0x2000:
+            i = address & 0x07FF
+            m = (ram[i] + 1) & 0x00FF
+            ram[i] = m
+        else:
+            m = ({load} + 1) & 0x00FF
+            {store}
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[m]
+    """,
+    "_INX": """
+        v = (cpu.x_reg + 1) & 0x00FF
+        cpu.x_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_INY": """
+        v = (cpu.y_reg + 1) & 0x00FF
+        cpu.y_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_JMP": """
+        cpu.pc_reg = address
+    """,
+    "_JSR": """
+        pc = cpu.pc_reg - 1
+        sp = cpu.sp_reg
+        ram[0x0100 + sp] = (pc >> 8) & 0x00FF
+        sp = (sp - 1) & 0x00FF
+        ram[0x0100 + sp] = pc & 0x00FF
+        cpu.sp_reg = (sp - 1) & 0x00FF
+        cpu.pc_reg = address
+    """,
+    "_LDA": """
+        v = {load}
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_LDX": """
+        v = {load}
+        cpu.x_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_LDY": """
+        v = {load}
+        cpu.y_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_LSR_A": """
+        v = cpu.a_reg
+        m = v >> 1
+        cpu.a_reg = m
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v & {FLAG_C}) | _ZN[m]
+    """,
+    "_LSR_M": """
+        v = {load}
+        m = v >> 1
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v & {FLAG_C}) | _ZN[m]
+        {store}
+    """,
+    "_NOP": "",
+    "_ORA": """
+        v = cpu.a_reg | {load}
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_PHA": """
+        sp = cpu.sp_reg
+        ram[0x0100 + sp] = cpu.a_reg
+        cpu.sp_reg = (sp - 1) & 0x00FF
+    """,
+    "_PHP": """
+        sp = cpu.sp_reg
+        ram[0x0100 + sp] = cpu.status_reg
+        cpu.sp_reg = (sp - 1) & 0x00FF
+    """,
+    "_PLA": """
+        sp = (cpu.sp_reg + 1) & 0x00FF
+        cpu.sp_reg = sp
+        v = ram[0x0100 + sp]
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_PLP": """
+        sp = (cpu.sp_reg + 1) & 0x00FF
+        cpu.sp_reg = sp
+        cpu.status_reg = ram[0x0100 + sp]
+    """,
+    "_ROL_A": """
+        v = (cpu.a_reg << 1) | (cpu.status_reg & {FLAG_C})
+        m = v & 0x00FF
+        cpu.a_reg = m
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v >> 8) | _ZN[m]
+    """,
+    "_ROL_M": """
+        v = ({load} << 1) | (cpu.status_reg & {FLAG_C})
+        m = v & 0x00FF
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v >> 8) | _ZN[m]
+        {store}
+    """,
+    "_ROR_A": """
+        v = cpu.a_reg
+        m = ((cpu.status_reg & {FLAG_C}) << 7) | (v >> 1)
+        cpu.a_reg = m
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v & {FLAG_C}) | _ZN[m]
+    """,
+    "_ROR_M": """
+        v = {load}
+        m = ((cpu.status_reg & {FLAG_C}) << 7) | (v >> 1)
+        cpu.status_reg = (cpu.status_reg & {_SHIFT_FLAGS_CLEAR}) | (v & {FLAG_C}) | _ZN[m]
+        {store}
+    """,
+    "_RTI": """
+        sp = (cpu.sp_reg + 1) & 0x00FF
+        cpu.status_reg = ram[0x0100 + sp]
+        sp = (sp + 1) & 0x00FF
+        pc = ram[0x0100 + sp]
+        sp = (sp + 1) & 0x00FF
+        cpu.pc_reg = pc | (ram[0x0100 + sp] << 8)
+        cpu.sp_reg = sp
+    """,
+    "_RTS": """
+        sp = (cpu.sp_reg + 1) & 0x00FF
+        pc = ram[0x0100 + sp]
+        sp = (sp + 1) & 0x00FF
+        cpu.pc_reg = (pc | (ram[0x0100 + sp] << 8)) + 1
+        cpu.sp_reg = sp
+    """,
+    "_SBC": """
+        i = ((cpu.status_reg & {FLAG_C}) << 16) | (cpu.a_reg << 8) | ({load} ^ 0x00FF)
+        cpu.a_reg = _ADD_RESULT[i]
+        cpu.status_reg = (cpu.status_reg & {_ADD_FLAGS_CLEAR}) | _ADD_FLAGS[i]
+    """,
+    "_SEC": """
+        cpu.status_reg |= {FLAG_C}
+    """,
+    "_SED": """
+        cpu.status_reg |= {FLAG_D}
+    """,
+    "_SEI": """
+        cpu.status_reg |= {FLAG_I}
+    """,
+    "_STA": """
+        m = cpu.a_reg
+        {store}
+    """,
+    "_STX": """
+        m = cpu.x_reg
+        {store}
+    """,
+    "_STY": """
+        m = cpu.y_reg
+        {store}
+    """,
+    "_TAX": """
+        v = cpu.a_reg
+        cpu.x_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_TAY": """
+        v = cpu.a_reg
+        cpu.y_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_TSX": """
+        v = cpu.sp_reg
+        cpu.x_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_TXA": """
+        v = cpu.x_reg
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_TXS": """
+        cpu.sp_reg = cpu.x_reg
+    """,
+    "_TYA": """
+        v = cpu.y_reg
+        cpu.a_reg = v
+        cpu.status_reg = (cpu.status_reg & {_ZN_FLAGS_CLEAR}) | _ZN[v]
+    """,
+    "_XXX": "",
+}
+
+# Operations that take the extra cycle of a page crossing:
+PAGE_CROSSING_OPERATIONS: Tuple[str, ...] = ("_ADC", "_AND", "_CMP", "_EOR", "_LDA", "_LDX", "_LDY", "_ORA", "_SBC")
+
+# Addressing modes whose operand always lies in the system RAM page 0x00:
+ZERO_PAGE_MODES: Tuple[str, ...] = ("_ZP0", "_ZPX", "_ZPY")
+
+# Operand accesses through the bus and, for the zero page modes, straight in the system RAM:
+BUS_ACCESS: Dict[str, str] = {"load": "read(address)", "store": "write(address, m)"}
+ZERO_PAGE_ACCESS: Dict[str, str] = {"load": "ram[address]", "store": "ram[address] = m"}
+
+# Constants of the cpu module that fill the status flag fields of the operations:
+FLAG_CONSTANTS: Tuple[str, ...] = ("FLAG_C", "FLAG_Z", "FLAG_I", "FLAG_D", "FLAG_B", "FLAG_V", "FLAG_N",
+                                   "_ZN_FLAGS_CLEAR", "_ADD_FLAGS_CLEAR", "_COMPARE_FLAGS_CLEAR",
+                                   "_BIT_FLAGS_CLEAR", "_SHIFT_FLAGS_CLEAR")
+
+
+def generate_handler(opcode: int, operate: str, address_mode: str, cycles: int, flags: Dict[str, int]) -> str:
+    """
+    Returns the source of a handler which performs the whole instruction and returns its cycles.
+    """
+    # Access zero page operands straight in the RAM:
+    access: Dict[str, str] = ZERO_PAGE_ACCESS if address_mode in ZERO_PAGE_MODES else BUS_ACCESS
+    operation: str = dedent(OPERATIONS[operate]).format(cycles=cycles, **access, **flags)
+
+    source: str = dedent(ADDRESS_MODES[address_mode]) + operation
+
+    # Add the extra cycle of a page crossing:
+    if address_mode in PAGE_CROSSING_MODES and operate in PAGE_CROSSING_OPERATIONS:
+        source += f"return {cycles} + (((address ^ base) >> 8) & 1)\n"
+    else:
+        source += f"return {cycles}\n"
+
+    return f"def op_{opcode:02X}():\n" + indent(source.lstrip("\n"), "    ")
+
+
+def build_handlers(cpu: CPU,
+                   lookup: Tuple[Tuple[str, Callable[[], int], Callable[[], int], int], ...],
+                   read: Callable[[int], int],
+                   read16: Callable[[int], int],
+                   write: Callable[[int, int], None],
+                   ram: bytearray) -> Tuple[Callable[[], int], ...]:
+    """
+    Creates a handler for every opcode that fuses its addressing mode with its operation.
+    """
+    instructions: Tuple[Tuple[str, str, int], ...] = tuple(
+        (operate.__name__, address_mode.__name__, cycles) for _, operate, address_mode, cycles in lookup)
+
+    # The handlers are closures over the CPU, the bus accessors and the system RAM holding the stack and zero page:
+    handlers: Dict[int, Callable[[], int]] = compile_builder(instructions)(cpu, read, read16, write, ram)
+
+    # Operations without an address to work on keep calling the CPU methods:
+    for opcode, (_, operate, address_mode, cycles) in enumerate(lookup):
+        if opcode not in handlers:
+            handlers[opcode] = _fallback_handler(operate, address_mode, cycles)
+
+    return tuple(handlers[i] for i in range(256))
+
+
+@lru_cache(maxsize=None)
+def compile_builder(instructions: Tuple[Tuple[str, str, int], ...]) -> Callable[..., Dict[int, Callable[[], int]]]:
+    """
+    Compiles the function which creates the handlers of the given (operation, addressing mode, cycles) instructions.
+    The source is generated and compiled once per instruction set and shared by all CPUs.
+    """
+    from . import cpu as cpu_module
+    from .cpu import _ADD_FLAGS, _ADD_RESULT, _ZN
+
+    # Status flag constants shared with the CPU methods:
+    flags: Dict[str, int] = {name: getattr(cpu_module, name) for name in FLAG_CONSTANTS}
+
+    sources: List[str] = []
+    names: Dict[int, str] = {}
+
+    for opcode, (operate, address_mode, cycles) in enumerate(instructions):
+        # Illegal and no-operation opcodes only take their cycles, one shared handler per cycle count:
+        if operate in ("_NOP", "_XXX") and address_mode == "_IMP":
+            if f"idle_{cycles}" not in names.values():
+                sources.append(f"def idle_{cycles}():\n    return {cycles}\n")
+            names[opcode] = f"idle_{cycles}"
+
+        # Operations without an address to work on are left to the fallback handlers:
+        elif operate in OPERATIONS and not (address_mode == "_IMP" and
+                                             any(use in OPERATIONS[operate] for use in ("address", "{load}", "{store}"))):
+            sources.append(generate_handler(opcode, operate, address_mode, cycles, flags))
+            names[opcode] = f"op_{opcode:02X}"
+
+    source: str = ("def build(cpu, read, read16, write, ram):\n" +
+                   indent("".join(sources), "    ") +
+                   f"    return {{{', '.join(f'0x{i:02X}: {name}' for i, name in names.items())}}}\n")
+
+    namespace: Dict[str, object] = {"_ADD_RESULT": _ADD_RESULT, "_ADD_FLAGS": _ADD_FLAGS, "_ZN": _ZN}
+    exec(compile(source, "<cpu handlers>", "exec"), namespace)
+    return namespace["build"]
+
+
+def _fallback_handler(operate: Callable[[], int], address_mode: Callable[[], int], cycles: int) -> Callable[[], int]:
+    """
+    Returns a handler which calls the addressing mode and the operation methods.
+    """
+    def handler() -> int:
+        return cycles + (address_mode() & operate())
+    return handler
@@ -0,0 +1,164 @@
+cimport cython
+
+cdef bint _COMPILED
+
+# Status register flags, masks and flag tables as C values:
+cdef int FLAG_C, FLAG_Z, FLAG_I, FLAG_D, FLAG_B, FLAG_U, FLAG_V, FLAG_N
+cdef int _ADD_FLAGS_CLEAR, _COMPARE_FLAGS_CLEAR, _BIT_FLAGS_CLEAR, _SHIFT_FLAGS_CLEAR, _ZN_FLAGS_CLEAR
+cdef bytes _ADD_RESULT, _ADD_FLAGS, _ZN
+
+
+cdef class CPU:
+    # CPU internal registers:
+    cdef public unsigned char a_reg, x_reg, y_reg, sp_reg, status_reg
+    cdef public int pc_reg
+
+    # Bus connection:
+    cdef object _bus, _bus_read, _bus_read16, _bus_write
+    cdef bytearray _ram
+
+    # Helper variables:
+    cdef int _address, _page_cross, _opcode, _cycles
+    cdef unsigned long long _clock_count
+
+    # Instruction lookup and dispatch tables:
+    cdef tuple _lookup, _address_modes, _operations, _handlers
+    cdef bytes _instruction_cycles, _address_mode_ids, _operation_ids
+
+    # Memory and stack access and the instruction loop compiled to C:
+    cdef inline int _read(self, int address, bint read_only=*)
+    cdef inline void _write(self, int address, int value)
+    cdef void _stack_push(self, int value)
+    cdef int _stack_pop(self)
+    @cython.locals(temp=int)
+    cdef inline void _compare(self, int register)
+
+    @cython.locals(elapsed=int, opcode=int)
+    cpdef void run(self, int cycles)
+
+    @cython.locals(address_mode=int, operation=int, extra_cycle1=int, extra_cycle2=int)
+    cdef int _execute(self, int opcode)
+
+    # Addressing modes:
+    cpdef int _IMP(self)
+    cpdef int _ACC(self)
+    @cython.locals(pc=int)
+    cpdef int _IMM(self)
+    @cython.locals(pc=int)
+    cpdef int _ZP0(self)
+    @cython.locals(pc=int)
+    cpdef int _ZPX(self)
+    @cython.locals(pc=int)
+    cpdef int _ZPY(self)
+    @cython.locals(pc=int, offset=int, address=int)
+    cpdef int _REL(self)
+    @cython.locals(pc=int)
+    cpdef int _ABS(self)
+    @cython.locals(pc=int, base=int)
+    cpdef int _ABX(self)
+    @cython.locals(pc=int, base=int)
+    cpdef int _ABY(self)
+    @cython.locals(pc=int, ptr=int)
+    cpdef int _IND(self)
+    @cython.locals(pc=int, ptr=int)
+    cpdef int _IZX(self)
+    @cython.locals(pc=int, base=int, ptr=int)
+    cpdef int _IZY(self)
+
+    # Instructions:
+    @cython.locals(m=int, i=int)
+    cpdef int _ADC(self)
+    @cython.locals(temp=int)
+    cpdef int _AND(self)
+    @cython.locals(m=int, temp=int)
+    cpdef int _ASL_A(self)
+    @cython.locals(address=int, m=int, temp=int)
+    cpdef int _ASL_M(self)
+    cpdef int _BCC(self)
+    cpdef int _BCS(self)
+    cpdef int _BEQ(self)
+    @cython.locals(m=int)
+    cpdef int _BIT(self)
+    cpdef int _BMI(self)
+    cpdef int _BNE(self)
+    cpdef int _BPL(self)
+    cpdef int _BRK(self)
+    cpdef int _BVC(self)
+    cpdef int _BVS(self)
+    cpdef int _CLC(self)
+    cpdef int _CLD(self)
+    cpdef int _CLI(self)
+    cpdef int _CLV(self)
+    cpdef int _CMP(self)
+    cpdef int _CPX(self)
+    cpdef int _CPY(self)
+    @cython.locals(address=int, m=int, ram=bytearray)
+    cpdef int _DEC(self)
+    @cython.locals(temp=int)
+    cpdef int _DEX(self)
+    @cython.locals(temp=int)
+    cpdef int _DEY(self)
+    @cython.locals(temp=int)
+    cpdef int _EOR(self)
+    @cython.locals(address=int, m=int, ram=bytearray)
+    cpdef int _INC(self)
+    @cython.locals(temp=int)
+    cpdef int _INX(self)
+    @cython.locals(temp=int)
+    cpdef int _INY(self)
+    cpdef int _JMP(self)
+    @cython.locals(pc=cython.ushort, sp=int, ram=bytearray)
+    cpdef int _JSR(self)
+    @cython.locals(temp=int)
+    cpdef int _LDA(self)
+    @cython.locals(temp=int)
+    cpdef int _LDX(self)
+    @cython.locals(temp=int)
+    cpdef int _LDY(self)
+    @cython.locals(m=int, temp=int)
+    cpdef int _LSR_A(self)
+    @cython.locals(address=int, m=int, temp=int)
+    cpdef int _LSR_M(self)
+    cpdef int _NOP(self)
+    @cython.locals(temp=int)
+    cpdef int _ORA(self)
+    @cython.locals(sp=int)
+    cpdef int _PHA(self)
+    @cython.locals(sp=int)
+    cpdef int _PHP(self)
+    @cython.locals(sp=int, m=int)
+    cpdef int _PLA(self)
+    @cython.locals(sp=int)
+    cpdef int _PLP(self)
+    @cython.locals(m=int, temp=int)
+    cpdef int _ROL_A(self)
+    @cython.locals(address=int, m=int, temp=int)
+    cpdef int _ROL_M(self)
+    @cython.locals(m=int, temp=int)
+    cpdef int _ROR_A(self)
+    @cython.locals(address=int, m=int, temp=int)
+    cpdef int _ROR_M(self)
+    @cython.locals(sp=int, ram=bytearray)
+    cpdef int _RTI(self)
+    @cython.locals(sp=int, ram=bytearray)
+    cpdef int _RTS(self)
+    @cython.locals(m=int, i=int)
+    cpdef int _SBC(self)
+    cpdef int _SEC(self)
+    cpdef int _SED(self)
+    cpdef int _SEI(self)
+    cpdef int _STA(self)
+    cpdef int _STX(self)
+    cpdef int _STY(self)
+    @cython.locals(temp=int)
+    cpdef int _TAX(self)
+    @cython.locals(temp=int)
+    cpdef int _TAY(self)
+    @cython.locals(temp=int)
+    cpdef int _TSX(self)
+    @cython.locals(temp=int)
+    cpdef int _TXA(self)
+    cpdef int _TXS(self)
+    @cython.locals(temp=int)
+    cpdef int _TYA(self)
+    cpdef int _XXX(self)
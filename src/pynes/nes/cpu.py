@@ -1,9 +1,96 @@
+# cython: annotation_typing=False
 from __future__ import annotations
 
-from enum import Enum
-from typing import Callable, Dict, List, NamedTuple, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from .bus import Bus
+from .codegen import build_handlers
+
+# The compiled build calls the methods faster than the generated handlers:
+try:
+    import cython
+    _COMPILED: bool = cython.compiled
+except ImportError:
+    _COMPILED = False
+
+# Status register flags:
+FLAG_C: int = 1 << 0  # Carry Flag
+FLAG_Z: int = 1 << 1  # Zero Flag
+FLAG_I: int = 1 << 2  # Interrupt Disable
+FLAG_D: int = 1 << 3  # Decimal Mode
+FLAG_B: int = 1 << 4  # Break Command
+FLAG_U: int = 1 << 5  # Unused
+FLAG_V: int = 1 << 6  # Overflow Flag
+FLAG_N: int = 1 << 7  # Negative Flag
+
+# Zero and negative flags of every 8-bit value:
+_ZN: bytes = bytes((0 if v else FLAG_Z) | (v & FLAG_N) for v in range(256))
+_ZN_FLAGS_CLEAR: int = ~(FLAG_Z | FLAG_N)
+
+
+def _add_flags(a: int, m: int, c: int) -> int:
+    """
+    Returns the C, Z, V and N flags of the 8-bit addition with carry.
+    """
+    temp = a + m + c
+    # The carry is the 9th bit of the sum and the overflow moves down from the sign bit:
+    return (temp >> 8) | ((~(a ^ m) & (a ^ temp) & 0x80) >> 1) | _ZN[temp & 0x00FF]
+
+
+# Results and flags of every 8-bit addition with carry, indexed by (C << 16) | (A << 8) | M:
+_ADD_RESULT: bytes = bytes((a + m + c) & 0xFF for c in range(2) for a in range(256) for m in range(256))
+_ADD_FLAGS: bytes = bytes(_add_flags(a, m, c) for c in range(2) for a in range(256) for m in range(256))
+_ADD_FLAGS_CLEAR: int = ~(FLAG_C | FLAG_Z | FLAG_V | FLAG_N)
+_COMPARE_FLAGS_CLEAR: int = ~(FLAG_C | FLAG_Z | FLAG_N)
+_BIT_FLAGS_CLEAR: int = ~(FLAG_Z | FLAG_V | FLAG_N)
+_SHIFT_FLAGS_CLEAR: int = ~(FLAG_C | FLAG_Z | FLAG_N)
+
+# Addressing modes and operations numbered as in the switches of CPU._execute:
+_ADDRESS_MODE_NAMES: Tuple[str, ...] = ("_IMP", "_ACC", "_IMM", "_ZP0", "_ZPX", "_ZPY", "_REL",
+                                        "_ABS", "_ABX", "_ABY", "_IND", "_IZX", "_IZY")
+_OPERATION_NAMES: Tuple[str, ...] = ("_NOP", "_XXX", "_ADC", "_AND", "_ASL_A", "_ASL_M", "_BCC", "_BCS", "_BEQ",
+                                     "_BIT", "_BMI", "_BNE", "_BPL", "_BRK", "_BVC", "_BVS", "_CLC", "_CLD",
+                                     "_CLI", "_CLV", "_CMP", "_CPX", "_CPY", "_DEC", "_DEX", "_DEY", "_EOR",
+                                     "_INC", "_INX", "_INY", "_JMP", "_JSR", "_LDA", "_LDX", "_LDY", "_LSR_A",
+                                     "_LSR_M", "_ORA", "_PHA", "_PHP", "_PLA", "_PLP", "_ROL_A", "_ROL_M", "_ROR_A",
+                                     "_ROR_M", "_RTI", "_RTS", "_SBC", "_SEC", "_SED", "_SEI", "_STA", "_STX",
+                                     "_STY", "_TAX", "_TAY", "_TSX", "_TXA", "_TXS", "_TYA")
+
+# Instructions as name:operate:address mode:cycles, eight opcodes per line:
+_INSTRUCTIONS: str = (
+    "BRK:BRK:IMM:7 ORA:ORA:IZX:6 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:3 ORA:ORA:ZP0:3 ASL:ASL_M:ZP0:5 ???:XXX:IMP:5 "
+    "PHP:PHP:IMP:3 ORA:ORA:IMM:2 ASL:ASL_A:ACC:2 ???:XXX:IMP:2 ???:NOP:IMP:4 ORA:ORA:ABS:4 ASL:ASL_M:ABS:6 ???:XXX:IMP:6 "
+    "BPL:BPL:REL:2 ORA:ORA:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 ORA:ORA:ZPX:4 ASL:ASL_M:ZPX:6 ???:XXX:IMP:6 "
+    "CLC:CLC:IMP:2 ORA:ORA:ABY:4 ???:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 ORA:ORA:ABX:4 ASL:ASL_M:ABX:7 ???:XXX:IMP:7 "
+    "JSR:JSR:ABS:6 AND:AND:IZX:6 ???:XXX:IMP:2 ???:XXX:IMP:8 BIT:BIT:ZP0:3 AND:AND:ZP0:3 ROL:ROL_M:ZP0:5 ???:XXX:IMP:5 "
+    "PLP:PLP:IMP:4 AND:AND:IMM:2 ROL:ROL_A:ACC:2 ???:XXX:IMP:2 BIT:BIT:ABS:4 AND:AND:ABS:4 ROL:ROL_M:ABS:6 ???:XXX:IMP:6 "
+    "BMI:BMI:REL:2 AND:AND:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 AND:AND:ZPX:4 ROL:ROL_M:ZPX:6 ???:XXX:IMP:6 "
+    "SEC:SEC:IMP:2 AND:AND:ABY:4 ???:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 AND:AND:ABX:4 ROL:ROL_M:ABX:7 ???:XXX:IMP:7 "
+    "RTI:RTI:IMP:6 EOR:EOR:IZX:6 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:3 EOR:EOR:ZP0:3 LSR:LSR_M:ZP0:5 ???:XXX:IMP:5 "
+    "PHA:PHA:IMP:3 EOR:EOR:IMM:2 LSR:LSR_A:ACC:2 ???:XXX:IMP:2 JMP:JMP:ABS:3 EOR:EOR:ABS:4 LSR:LSR_M:ABS:6 ???:XXX:IMP:6 "
+    "BVC:BVC:REL:2 EOR:EOR:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 EOR:EOR:ZPX:4 LSR:LSR_M:ZPX:6 ???:XXX:IMP:6 "
+    "CLI:CLI:IMP:2 EOR:EOR:ABY:4 ???:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 EOR:EOR:ABX:4 LSR:LSR_M:ABX:7 ???:XXX:IMP:7 "
+    "RTS:RTS:IMP:6 ADC:ADC:IZX:6 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:3 ADC:ADC:ZP0:3 ROR:ROR_M:ZP0:5 ???:XXX:IMP:5 "
+    "PLA:PLA:IMP:4 ADC:ADC:IMM:2 ROR:ROR_A:ACC:2 ???:XXX:IMP:2 JMP:JMP:IND:5 ADC:ADC:ABS:4 ROR:ROR_M:ABS:6 ???:XXX:IMP:6 "
+    "BVS:BVS:REL:2 ADC:ADC:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 ADC:ADC:ZPX:4 ROR:ROR_M:ZPX:6 ???:XXX:IMP:6 "
+    "SEI:SEI:IMP:2 ADC:ADC:ABY:4 ???:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 ADC:ADC:ABX:4 ROR:ROR_M:ABX:7 ???:XXX:IMP:7 "
+    "???:NOP:IMP:2 STA:STA:IZX:6 ???:NOP:IMP:2 ???:XXX:IMP:6 STY:STY:ZP0:3 STA:STA:ZP0:3 STX:STX:ZP0:3 ???:XXX:IMP:3 "
+    "DEY:DEY:IMP:2 ???:NOP:IMP:2 TXA:TXA:IMP:2 ???:XXX:IMP:2 STY:STY:ABS:4 STA:STA:ABS:4 STX:STX:ABS:4 ???:XXX:IMP:4 "
+    "BCC:BCC:REL:2 STA:STA:IZY:6 ???:XXX:IMP:2 ???:XXX:IMP:6 STY:STY:ZPX:4 STA:STA:ZPX:4 STX:STX:ZPY:4 ???:XXX:IMP:4 "
+    "TYA:TYA:IMP:2 STA:STA:ABY:5 TXS:TXS:IMP:2 ???:XXX:IMP:5 ???:NOP:IMP:5 STA:STA:ABX:5 ???:XXX:IMP:5 ???:XXX:IMP:5 "
+    "LDY:LDY:IMM:2 LDA:LDA:IZX:6 LDX:LDX:IMM:2 ???:XXX:IMP:6 LDY:LDY:ZP0:3 LDA:LDA:ZP0:3 LDX:LDX:ZP0:3 ???:XXX:IMP:3 "
+    "TAY:TAY:IMP:2 LDA:LDA:IMM:2 TAX:TAX:IMP:2 ???:XXX:IMP:2 LDY:LDY:ABS:4 LDA:LDA:ABS:4 LDX:LDX:ABS:4 ???:XXX:IMP:4 "
+    "BCS:BCS:REL:2 LDA:LDA:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:5 LDY:LDY:ZPX:4 LDA:LDA:ZPX:4 LDX:LDX:ZPY:4 ???:XXX:IMP:4 "
+    "CLV:CLV:IMP:2 LDA:LDA:ABY:4 TSX:TSX:IMP:2 ???:XXX:IMP:4 LDY:LDY:ABX:4 LDA:LDA:ABX:4 LDX:LDX:ABY:4 ???:XXX:IMP:4 "
+    "CPY:CPY:IMM:2 CMP:CMP:IZX:6 ???:NOP:IMP:2 ???:XXX:IMP:8 CPY:CPY:ZP0:3 CMP:CMP:ZP0:3 DEC:DEC:ZP0:5 ???:XXX:IMP:5 "
+    "INY:INY:IMP:2 CMP:CMP:IMM:2 DEX:DEX:IMP:2 ???:XXX:IMP:2 CPY:CPY:ABS:4 CMP:CMP:ABS:4 DEC:DEC:ABS:6 ???:XXX:IMP:6 "
+    "BNE:BNE:REL:2 CMP:CMP:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 CMP:CMP:ZPX:4 DEC:DEC:ZPX:6 ???:XXX:IMP:6 "
+    "CLD:CLD:IMP:2 CMP:CMP:ABY:4 NOP:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 CMP:CMP:ABX:4 DEC:DEC:ABX:7 ???:XXX:IMP:7 "
+    "CPX:CPX:IMM:2 SBC:SBC:IZX:6 ???:NOP:IMP:2 ???:XXX:IMP:8 CPX:CPX:ZP0:3 SBC:SBC:ZP0:3 INC:INC:ZP0:5 ???:XXX:IMP:5 "
+    "INX:INX:IMP:2 SBC:SBC:IMM:2 NOP:NOP:IMP:2 ???:SBC:IMP:2 CPX:CPX:ABS:4 SBC:SBC:ABS:4 INC:INC:ABS:6 ???:XXX:IMP:6 "
+    "BEQ:BEQ:REL:2 SBC:SBC:IZY:5 ???:XXX:IMP:2 ???:XXX:IMP:8 ???:NOP:IMP:4 SBC:SBC:ZPX:4 INC:INC:ZPX:6 ???:XXX:IMP:6 "
+    "SED:SED:IMP:2 SBC:SBC:ABY:4 NOP:NOP:IMP:2 ???:XXX:IMP:7 ???:NOP:IMP:4 SBC:SBC:ABX:4 INC:INC:ABX:7 ???:XXX:IMP:7"
+)
 
 
 class CPU:
@@ -12,29 +99,10 @@ class CPU:
     """
 
     __slots__ = ("a_reg", "x_reg", "y_reg", "sp_reg", "pc_reg", "status_reg",
-                 "_bus", "_address", "_opcode", "_cycles", "_clock_count", "_lookup")
-
-    class FLAGS(Enum):
-        """
-        The status register flags.
-        """
-        C = 1 << 0  # Carry Flag
-        Z = 1 << 1  # Zero Flag
-        I = 1 << 2  # Interrupt Disable
-        D = 1 << 3  # Decimal Mode
-        B = 1 << 4  # Break Command
-        U = 1 << 5  # Unused
-        V = 1 << 6  # Overflow Flag
-        N = 1 << 7  # Negative Flag
-
-    class INSTRUCTION(NamedTuple):
-        """
-        A Tuple that holds information about instruction supported by the CPU.
-        """
-        name: str
-        operate: Callable[[], int]
-        address_mode: Callable[[], int]
-        cycles: int
+                 "_bus", "_bus_read", "_bus_read16", "_bus_write", "_ram",
+                 "_address", "_page_cross", "_opcode", "_cycles", "_clock_count", "_lookup",
+                 "_address_modes", "_operations", "_instruction_cycles", "_address_mode_ids", "_operation_ids",
+                 "_handlers")
 
     def __init__(self) -> None:
         # CPU internal registers:
@@ -47,164 +115,76 @@ class CPU:
 
         # Helper variables:
         self._address: int = 0x0000  # Memory address
+        self._page_cross: int = 0    # Whether the branch target lies on another page
         self._opcode: int = 0x00     # Instruction byte
         self._cycles: int = 0        # Instruction remaining cycles
         self._clock_count: int = 0   # Global accumulation of the number of clocks
 
-        self._lookup: Tuple[CPU.INSTRUCTION, ...] = (
-            CPU.INSTRUCTION("BRK", self._BRK, self._IMM, 7), CPU.INSTRUCTION("ORA", self._ORA, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 3), CPU.INSTRUCTION("ORA", self._ORA, self._ZP0, 3),
-            CPU.INSTRUCTION("ASL", self._ASL, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("PHP", self._PHP, self._IMP, 3), CPU.INSTRUCTION("ORA", self._ORA, self._IMM, 2),
-            CPU.INSTRUCTION("ASL", self._ASL, self._ACC, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("ORA", self._ORA, self._ABS, 4),
-            CPU.INSTRUCTION("ASL", self._ASL, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BPL", self._BPL, self._REL, 2), CPU.INSTRUCTION("ORA", self._ORA, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("ORA", self._ORA, self._ZPX, 4),
-            CPU.INSTRUCTION("ASL", self._ASL, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("CLC", self._CLC, self._IMP, 2), CPU.INSTRUCTION("ORA", self._ORA, self._ABY, 4),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("ORA", self._ORA, self._ABX, 4),
-            CPU.INSTRUCTION("ASL", self._ASL, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("JSR", self._JSR, self._ABS, 6), CPU.INSTRUCTION("AND", self._AND, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("BIT", self._BIT, self._ZP0, 3), CPU.INSTRUCTION("AND", self._AND, self._ZP0, 3),
-            CPU.INSTRUCTION("ROL", self._ROL, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("PLP", self._PLP, self._IMP, 4), CPU.INSTRUCTION("AND", self._AND, self._IMM, 2),
-            CPU.INSTRUCTION("ROL", self._ROL, self._ACC, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("BIT", self._BIT, self._ABS, 4), CPU.INSTRUCTION("AND", self._AND, self._ABS, 4),
-            CPU.INSTRUCTION("ROL", self._ROL, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BMI", self._BMI, self._REL, 2), CPU.INSTRUCTION("AND", self._AND, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("AND", self._AND, self._ZPX, 4),
-            CPU.INSTRUCTION("ROL", self._ROL, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("SEC", self._SEC, self._IMP, 2), CPU.INSTRUCTION("AND", self._AND, self._ABY, 4),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("AND", self._AND, self._ABX, 4),
-            CPU.INSTRUCTION("ROL", self._ROL, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("RTI", self._RTI, self._IMP, 6), CPU.INSTRUCTION("EOR", self._EOR, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 3), CPU.INSTRUCTION("EOR", self._EOR, self._ZP0, 3),
-            CPU.INSTRUCTION("LSR", self._LSR, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("PHA", self._PHA, self._IMP, 3), CPU.INSTRUCTION("EOR", self._EOR, self._IMM, 2),
-            CPU.INSTRUCTION("LSR", self._LSR, self._ACC, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("JMP", self._JMP, self._ABS, 3), CPU.INSTRUCTION("EOR", self._EOR, self._ABS, 4),
-            CPU.INSTRUCTION("LSR", self._LSR, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BVC", self._BVC, self._REL, 2), CPU.INSTRUCTION("EOR", self._EOR, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("EOR", self._EOR, self._ZPX, 4),
-            CPU.INSTRUCTION("LSR", self._LSR, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("CLI", self._CLI, self._IMP, 2), CPU.INSTRUCTION("EOR", self._EOR, self._ABY, 4),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("EOR", self._EOR, self._ABX, 4),
-            CPU.INSTRUCTION("LSR", self._LSR, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("RTS", self._RTS, self._IMP, 6), CPU.INSTRUCTION("ADC", self._ADC, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 3), CPU.INSTRUCTION("ADC", self._ADC, self._ZP0, 3),
-            CPU.INSTRUCTION("ROR", self._ROR, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("PLA", self._PLA, self._IMP, 4), CPU.INSTRUCTION("ADC", self._ADC, self._IMM, 2),
-            CPU.INSTRUCTION("ROR", self._ROR, self._ACC, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("JMP", self._JMP, self._IND, 5), CPU.INSTRUCTION("ADC", self._ADC, self._ABS, 4),
-            CPU.INSTRUCTION("ROR", self._ROR, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BVS", self._BVS, self._REL, 2), CPU.INSTRUCTION("ADC", self._ADC, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("ADC", self._ADC, self._ZPX, 4),
-            CPU.INSTRUCTION("ROR", self._ROR, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("SEI", self._SEI, self._IMP, 2), CPU.INSTRUCTION("ADC", self._ADC, self._ABY, 4),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("ADC", self._ADC, self._ABX, 4),
-            CPU.INSTRUCTION("ROR", self._ROR, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("STA", self._STA, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("STY", self._STY, self._ZP0, 3), CPU.INSTRUCTION("STA", self._STA, self._ZP0, 3),
-            CPU.INSTRUCTION("STX", self._STX, self._ZP0, 3), CPU.INSTRUCTION("???", self._XXX, self._IMP, 3),
-            CPU.INSTRUCTION("DEY", self._DEY, self._IMP, 2), CPU.INSTRUCTION("???", self._NOP, self._IMP, 2),
-            CPU.INSTRUCTION("TXA", self._TXA, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("STY", self._STY, self._ABS, 4), CPU.INSTRUCTION("STA", self._STA, self._ABS, 4),
-            CPU.INSTRUCTION("STX", self._STX, self._ABS, 4), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("BCC", self._BCC, self._REL, 2), CPU.INSTRUCTION("STA", self._STA, self._IZY, 6),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("STY", self._STY, self._ZPX, 4), CPU.INSTRUCTION("STA", self._STA, self._ZPX, 4),
-            CPU.INSTRUCTION("STX", self._STX, self._ZPY, 4), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("TYA", self._TYA, self._IMP, 2), CPU.INSTRUCTION("STA", self._STA, self._ABY, 5),
-            CPU.INSTRUCTION("TXS", self._TXS, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 5), CPU.INSTRUCTION("STA", self._STA, self._ABX, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("LDY", self._LDY, self._IMM, 2), CPU.INSTRUCTION("LDA", self._LDA, self._IZX, 6),
-            CPU.INSTRUCTION("LDX", self._LDX, self._IMM, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("LDY", self._LDY, self._ZP0, 3), CPU.INSTRUCTION("LDA", self._LDA, self._ZP0, 3),
-            CPU.INSTRUCTION("LDX", self._LDX, self._ZP0, 3), CPU.INSTRUCTION("???", self._XXX, self._IMP, 3),
-            CPU.INSTRUCTION("TAY", self._TAY, self._IMP, 2), CPU.INSTRUCTION("LDA", self._LDA, self._IMM, 2),
-            CPU.INSTRUCTION("TAX", self._TAX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("LDY", self._LDY, self._ABS, 4), CPU.INSTRUCTION("LDA", self._LDA, self._ABS, 4),
-            CPU.INSTRUCTION("LDX", self._LDX, self._ABS, 4), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("BCS", self._BCS, self._REL, 2), CPU.INSTRUCTION("LDA", self._LDA, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("LDY", self._LDY, self._ZPX, 4), CPU.INSTRUCTION("LDA", self._LDA, self._ZPX, 4),
-            CPU.INSTRUCTION("LDX", self._LDX, self._ZPY, 4), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("CLV", self._CLV, self._IMP, 2), CPU.INSTRUCTION("LDA", self._LDA, self._ABY, 4),
-            CPU.INSTRUCTION("TSX", self._TSX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("LDY", self._LDY, self._ABX, 4), CPU.INSTRUCTION("LDA", self._LDA, self._ABX, 4),
-            CPU.INSTRUCTION("LDX", self._LDX, self._ABY, 4), CPU.INSTRUCTION("???", self._XXX, self._IMP, 4),
-            CPU.INSTRUCTION("CPY", self._CPY, self._IMM, 2), CPU.INSTRUCTION("CMP", self._CMP, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("CPY", self._CPY, self._ZP0, 3), CPU.INSTRUCTION("CMP", self._CMP, self._ZP0, 3),
-            CPU.INSTRUCTION("DEC", self._DEC, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("INY", self._INY, self._IMP, 2), CPU.INSTRUCTION("CMP", self._CMP, self._IMM, 2),
-            CPU.INSTRUCTION("DEX", self._DEX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 2),
-            CPU.INSTRUCTION("CPY", self._CPY, self._ABS, 4), CPU.INSTRUCTION("CMP", self._CMP, self._ABS, 4),
-            CPU.INSTRUCTION("DEC", self._DEC, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BNE", self._BNE, self._REL, 2), CPU.INSTRUCTION("CMP", self._CMP, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("CMP", self._CMP, self._ZPX, 4),
-            CPU.INSTRUCTION("DEC", self._DEC, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("CLD", self._CLD, self._IMP, 2), CPU.INSTRUCTION("CMP", self._CMP, self._ABY, 4),
-            CPU.INSTRUCTION("NOP", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("CMP", self._CMP, self._ABX, 4),
-            CPU.INSTRUCTION("DEC", self._DEC, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("CPX", self._CPX, self._IMM, 2), CPU.INSTRUCTION("SBC", self._SBC, self._IZX, 6),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("CPX", self._CPX, self._ZP0, 3), CPU.INSTRUCTION("SBC", self._SBC, self._ZP0, 3),
-            CPU.INSTRUCTION("INC", self._INC, self._ZP0, 5), CPU.INSTRUCTION("???", self._XXX, self._IMP, 5),
-            CPU.INSTRUCTION("INX", self._INX, self._IMP, 2), CPU.INSTRUCTION("SBC", self._SBC, self._IMM, 2),
-            CPU.INSTRUCTION("NOP", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._SBC, self._IMP, 2),
-            CPU.INSTRUCTION("CPX", self._CPX, self._ABS, 4), CPU.INSTRUCTION("SBC", self._SBC, self._ABS, 4),
-            CPU.INSTRUCTION("INC", self._INC, self._ABS, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("BEQ", self._BEQ, self._REL, 2), CPU.INSTRUCTION("SBC", self._SBC, self._IZY, 5),
-            CPU.INSTRUCTION("???", self._XXX, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 8),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("SBC", self._SBC, self._ZPX, 4),
-            CPU.INSTRUCTION("INC", self._INC, self._ZPX, 6), CPU.INSTRUCTION("???", self._XXX, self._IMP, 6),
-            CPU.INSTRUCTION("SED", self._SED, self._IMP, 2), CPU.INSTRUCTION("SBC", self._SBC, self._ABY, 4),
-            CPU.INSTRUCTION("NOP", self._NOP, self._IMP, 2), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
-            CPU.INSTRUCTION("???", self._NOP, self._IMP, 4), CPU.INSTRUCTION("SBC", self._SBC, self._ABX, 4),
-            CPU.INSTRUCTION("INC", self._INC, self._ABX, 7), CPU.INSTRUCTION("???", self._XXX, self._IMP, 7),
+        # Instructions supported by the CPU as (name, operate, address mode, cycles):
+        self._lookup: Tuple[Tuple[str, Callable[[], int], Callable[[], int], int], ...] = tuple(
+            (name, getattr(self, "_" + operate), getattr(self, "_" + address_mode), int(cycles))
+            for name, operate, address_mode, cycles in (entry.split(":") for entry in _INSTRUCTIONS.split())
         )
 
-    def _get_flag(self, flag: CPU.FLAGS) -> bool:
-        """
-        Returns the state of a specific bit of the status register.
-        """
-        return (self.status_reg & flag.value) > 0
+        # Lookup table split into parallel tables indexed by the opcode for the instruction dispatch:
+        self._address_modes: Tuple[Optional[Callable[[], int]], ...] = tuple(
+            # Implied and accumulator modes fetch nothing, so the dispatch skips them:
+            None if i[2] in (self._IMP, self._ACC) else i[2] for i in self._lookup
+        )
+        self._operations: Tuple[Optional[Callable[[], int]], ...] = tuple(
+            # Implied no-operations are left out so that the dispatch skips them:
+            None if i[1] in (self._NOP, self._XXX) and i[2] == self._IMP else i[1] for i in self._lookup
+        )
+        # The byte-sized tables are kept in bytes, which the compiled build indexes as C arrays:
+        self._instruction_cycles: bytes = bytes(i[3] for i in self._lookup)
 
-    def _set_flag(self, flag: CPU.FLAGS, value: bool) -> None:
-        """
-        Sets or resets a specific bit of the status register.
-        """
-        self.status_reg ^= (-value ^ self.status_reg) & flag.value
+        # Numbers of the addressing mode and the operation of each opcode for the switch dispatch:
+        self._address_mode_ids: bytes = bytes(_ADDRESS_MODE_NAMES.index(i[2].__name__) for i in self._lookup)
+        self._operation_ids: bytes = bytes(_OPERATION_NAMES.index(i[1].__name__) for i in self._lookup)
+
+        # Generated instruction handlers, built once the bus is connected:
+        self._handlers: Tuple[Callable[[], int], ...] = ()
 
     def _read(self, address: int, read_only: bool = False) -> int:
         """
         Reads a byte from the main bus at the specified address.
         """
-        return self._bus.read(address, read_only)
+        # System RAM address range (0x0000-0x1FFF) - read without the bus:
+        if address < 0x2000:
+            return self._ram[address & 0x07FF]
+        return self._bus_read(address, read_only)
 
     def _write(self, address: int, value: int) -> None:
         """
         Writes a byte to the main bus at the specified address.
         """
-        self._bus.write(address, value)
+        # System RAM address range (0x0000-0x1FFF) - written without the bus:
+        if address < 0x2000:
+            self._ram[address & 0x07FF] = value
+        else:
+            self._bus_write(address, value)
+
+    def _stack_push(self, value: int) -> None:
+        """
+        Pushes a byte to the stack, which always lies in the system RAM page 0x01.
+        """
+        self._ram[0x0100 + self.sp_reg] = value
+        self.sp_reg = (self.sp_reg - 1) & 0x00FF
+
+    def _stack_pop(self) -> int:
+        """
+        Pops a byte off the stack, which always lies in the system RAM page 0x01.
+        """
+        self.sp_reg = (self.sp_reg + 1) & 0x00FF
+        return self._ram[0x0100 + self.sp_reg]
+
+    def _compare(self, register: int) -> None:
+        """
+        Sets the flags of the comparison of a register with the fetched byte, shared by CMP, CPX and CPY.
+        """
+        # The carry is the inverted borrow of the subtraction:
+        temp = register + 0x0100 - self._read(self._address)
+        self.status_reg = (self.status_reg & _COMPARE_FLAGS_CLEAR) | (temp >> 8) | _ZN[temp & 0x00FF]
 
     def connect_bus(self, bus: Bus) -> None:
         """
@@ -212,20 +192,32 @@ class CPU:
         """
         self._bus: Bus = bus
 
+        # Bound bus accessors used by the instructions:
+        self._bus_read: Callable[[int, bool], int] = bus.read
+        self._bus_read16: Callable[[int], int] = bus.read16
+        self._bus_write: Callable[[int, int], None] = bus.write
+
+        # The stack and the zero page are accessed in the system RAM directly:
+        self._ram: bytearray = bus.ram
+
+        # Generate the instruction handlers bound to the bus accessors:
+        if not _COMPILED:
+            self._handlers = build_handlers(self, self._lookup, self._bus_read, self._bus_read16, self._bus_write,
+                                            self._ram)
+
     def reset(self) -> None:
         """
         Forces CPU into known state.
         """
         # Read new program counter location from fixed address:
-        self.pc_reg = self._read(0xFFFC)
-        self.pc_reg |= self._read(0xFFFD) << 8
+        self.pc_reg = self._bus_read16(0xFFFC)
 
         # Reset internal registers:
         self.a_reg = 0x00
         self.x_reg = 0x00
         self.y_reg = 0x00
         self.sp_reg = 0xFD
-        self.status_reg = 0x34
+        self.status_reg = FLAG_U | FLAG_B | FLAG_I
 
         # Reset takes time:
         self._cycles = 8
@@ -234,25 +226,19 @@ class CPU:
         """
         Executes an instruction at a specific location.
         """
-        if not self._get_flag(CPU.FLAGS.I):
+        if not self.status_reg & FLAG_I:
             # Push the program counter to the stack:
-            self._write(0x0100 + self.sp_reg, (self.pc_reg >> 8) & 0x00FF)
-            self.sp_reg -= 1
-            self._write(0x0100 + self.sp_reg, self.pc_reg & 0x00FF)
-            self.sp_reg -= 1
+            self._stack_push((self.pc_reg >> 8) & 0x00FF)
+            self._stack_push(self.pc_reg & 0x00FF)
 
             # Set status register flags:
-            self._set_flag(CPU.FLAGS.B, False)
-            self._set_flag(CPU.FLAGS.U, True)
-            self._set_flag(CPU.FLAGS.I, True)
+            self.status_reg = (self.status_reg & ~FLAG_B) | FLAG_U | FLAG_I
 
             # Push the status register to the stack:
-            self._write(0x0100 + self.sp_reg, self.status_reg)
-            self.sp_reg -= 1
+            self._stack_push(self.status_reg)
 
             # Read new program counter location from fixed address:
-            self.pc_reg = self._read(0xFFFE)
-            self.pc_reg |= self._read(0xFFFF) << 8
+            self.pc_reg = self._bus_read16(0xFFFE)
 
             # IRQs take time:
             self._cycles = 7
@@ -262,23 +248,17 @@ class CPU:
         Similar to interrupt_request, but cannot be disabled.
         """
         # Push the program counter to the stack:
-        self._write(0x0100 + self.sp_reg, (self.pc_reg >> 8) & 0x00FF)
-        self.sp_reg -= 1
-        self._write(0x0100 + self.sp_reg, self.pc_reg & 0x00FF)
-        self.sp_reg -= 1
+        self._stack_push((self.pc_reg >> 8) & 0x00FF)
+        self._stack_push(self.pc_reg & 0x00FF)
 
         # Set status register flags:
-        self._set_flag(CPU.FLAGS.B, False)
-        self._set_flag(CPU.FLAGS.U, True)
-        self._set_flag(CPU.FLAGS.I, True)
+        self.status_reg = (self.status_reg & ~FLAG_B) | FLAG_U | FLAG_I
 
         # Push the status register to the stack:
-        self._write(0x0100 + self.sp_reg, self.status_reg)
-        self.sp_reg -= 1
+        self._stack_push(self.status_reg)
 
         # Read new program counter location from fixed address:
-        self.pc_reg = self._read(0xFFFA)
-        self.pc_reg |= self._read(0xFFFB) << 8
+        self.pc_reg = self._bus_read16(0xFFFA)
 
         # IRQs take time:
         self._cycles = 8
@@ -289,26 +269,232 @@ class CPU:
         """
         if self._cycles == 0:
             # Read next instruction byte:
-            self._opcode = self._read(self.pc_reg)
+            opcode: int = self._bus_read(self.pc_reg)
+            self._opcode = opcode
             self.pc_reg += 1
 
-            # Fetch intermediate data and perform the operation:
-            extra_cycle1: int = self._lookup[self._opcode].address_mode()
-            extra_cycle2: int = self._lookup[self._opcode].operate()
-
-            # Set the required number of cycles:
-            self._cycles = self._lookup[self._opcode].cycles + (extra_cycle1 & extra_cycle2)
+            if _COMPILED:
+                # Dispatch through the switches compiled to C:
+                self._cycles = self._execute(opcode)
+            else:
+                address_mode: Optional[Callable[[], int]] = self._address_modes[opcode]
+                if address_mode is None:
+                    # Perform the operation on no data, unless it is a no-operation:
+                    operate: Optional[Callable[[], int]] = self._operations[opcode]
+                    if operate is not None:
+                        operate()
+
+                    # Set the required number of cycles:
+                    self._cycles = self._instruction_cycles[opcode]
+                else:
+                    # Fetch intermediate data and perform the operation:
+                    extra_cycle1: int = address_mode()
+                    extra_cycle2: int = self._operations[opcode]()
+
+                    # Set the required number of cycles:
+                    self._cycles = self._instruction_cycles[opcode] + (extra_cycle1 & extra_cycle2)
 
         self._clock_count += 1
         self._cycles -= 1
 
+    def run(self, cycles: int) -> None:
+        """
+        Performs the given number of clock cycles' worth of update in one call.
+        Instructions are executed whole on their first cycle, as clock() does.
+        """
+        # Keep the bus accessor and the instruction handlers in locals for the loop:
+        read: Callable[[int], int] = self._bus_read
+        handlers: Tuple[Callable[[], int], ...] = self._handlers
+
+        # Start with the remaining cycles of the instruction in progress:
+        elapsed: int = self._cycles
+
+        if handlers:
+            while elapsed < cycles:
+                # Read next instruction byte:
+                opcode: int = read(self.pc_reg)
+                self._opcode = opcode
+                self.pc_reg += 1
+
+                # Perform the whole instruction and count the cycles it takes:
+                elapsed += handlers[opcode]()
+        else:
+            while elapsed < cycles:
+                # Read next instruction byte:
+                opcode = read(self.pc_reg)
+                self._opcode = opcode
+                self.pc_reg += 1
+
+                # Dispatch through the switches compiled to C:
+                elapsed += self._execute(opcode)
+
+        # Leave the cycles past the given ones to the last instruction:
+        self._cycles = elapsed - cycles
+        self._clock_count += cycles
+
+    def _execute(self, opcode: int) -> int:
+        """
+        Performs the instruction by switching on the numbers of its addressing mode and operation.
+        Returns the number of cycles the instruction takes.
+        The compiled build turns the switches into jump tables with direct calls.
+        """
+        # Fetch intermediate data, the implied and accumulator modes fetch nothing:
+        address_mode: int = self._address_mode_ids[opcode]
+        extra_cycle1: int = 0
+        if address_mode == 2:
+            extra_cycle1 = self._IMM()
+        elif address_mode == 3:
+            extra_cycle1 = self._ZP0()
+        elif address_mode == 4:
+            extra_cycle1 = self._ZPX()
+        elif address_mode == 5:
+            extra_cycle1 = self._ZPY()
+        elif address_mode == 6:
+            extra_cycle1 = self._REL()
+        elif address_mode == 7:
+            extra_cycle1 = self._ABS()
+        elif address_mode == 8:
+            extra_cycle1 = self._ABX()
+        elif address_mode == 9:
+            extra_cycle1 = self._ABY()
+        elif address_mode == 10:
+            extra_cycle1 = self._IND()
+        elif address_mode == 11:
+            extra_cycle1 = self._IZX()
+        elif address_mode == 12:
+            extra_cycle1 = self._IZY()
+
+        # Perform the operation, the no-operations do nothing:
+        operation: int = self._operation_ids[opcode]
+        extra_cycle2: int = 0
+        if operation == 2:
+            extra_cycle2 = self._ADC()
+        elif operation == 3:
+            extra_cycle2 = self._AND()
+        elif operation == 4:
+            extra_cycle2 = self._ASL_A()
+        elif operation == 5:
+            extra_cycle2 = self._ASL_M()
+        elif operation == 6:
+            extra_cycle2 = self._BCC()
+        elif operation == 7:
+            extra_cycle2 = self._BCS()
+        elif operation == 8:
+            extra_cycle2 = self._BEQ()
+        elif operation == 9:
+            extra_cycle2 = self._BIT()
+        elif operation == 10:
+            extra_cycle2 = self._BMI()
+        elif operation == 11:
+            extra_cycle2 = self._BNE()
+        elif operation == 12:
+            extra_cycle2 = self._BPL()
+        elif operation == 13:
+            extra_cycle2 = self._BRK()
+        elif operation == 14:
+            extra_cycle2 = self._BVC()
+        elif operation == 15:
+            extra_cycle2 = self._BVS()
+        elif operation == 16:
+            extra_cycle2 = self._CLC()
+        elif operation == 17:
+            extra_cycle2 = self._CLD()
+        elif operation == 18:
+            extra_cycle2 = self._CLI()
+        elif operation == 19:
+            extra_cycle2 = self._CLV()
+        elif operation == 20:
+            extra_cycle2 = self._CMP()
+        elif operation == 21:
+            extra_cycle2 = self._CPX()
+        elif operation == 22:
+            extra_cycle2 = self._CPY()
+        elif operation == 23:
+            extra_cycle2 = self._DEC()
+        elif operation == 24:
+            extra_cycle2 = self._DEX()
+        elif operation == 25:
+            extra_cycle2 = self._DEY()
+        elif operation == 26:
+            extra_cycle2 = self._EOR()
+        elif operation == 27:
+            extra_cycle2 = self._INC()
+        elif operation == 28:
+            extra_cycle2 = self._INX()
+        elif operation == 29:
+            extra_cycle2 = self._INY()
+        elif operation == 30:
+            extra_cycle2 = self._JMP()
+        elif operation == 31:
+            extra_cycle2 = self._JSR()
+        elif operation == 32:
+            extra_cycle2 = self._LDA()
+        elif operation == 33:
+            extra_cycle2 = self._LDX()
+        elif operation == 34:
+            extra_cycle2 = self._LDY()
+        elif operation == 35:
+            extra_cycle2 = self._LSR_A()
+        elif operation == 36:
+            extra_cycle2 = self._LSR_M()
+        elif operation == 37:
+            extra_cycle2 = self._ORA()
+        elif operation == 38:
+            extra_cycle2 = self._PHA()
+        elif operation == 39:
+            extra_cycle2 = self._PHP()
+        elif operation == 40:
+            extra_cycle2 = self._PLA()
+        elif operation == 41:
+            extra_cycle2 = self._PLP()
+        elif operation == 42:
+            extra_cycle2 = self._ROL_A()
+        elif operation == 43:
+            extra_cycle2 = self._ROL_M()
+        elif operation == 44:
+            extra_cycle2 = self._ROR_A()
+        elif operation == 45:
+            extra_cycle2 = self._ROR_M()
+        elif operation == 46:
+            extra_cycle2 = self._RTI()
+        elif operation == 47:
+            extra_cycle2 = self._RTS()
+        elif operation == 48:
+            extra_cycle2 = self._SBC()
+        elif operation == 49:
+            extra_cycle2 = self._SEC()
+        elif operation == 50:
+            extra_cycle2 = self._SED()
+        elif operation == 51:
+            extra_cycle2 = self._SEI()
+        elif operation == 52:
+            extra_cycle2 = self._STA()
+        elif operation == 53:
+            extra_cycle2 = self._STX()
+        elif operation == 54:
+            extra_cycle2 = self._STY()
+        elif operation == 55:
+            extra_cycle2 = self._TAX()
+        elif operation == 56:
+            extra_cycle2 = self._TAY()
+        elif operation == 57:
+            extra_cycle2 = self._TSX()
+        elif operation == 58:
+            extra_cycle2 = self._TXA()
+        elif operation == 59:
+            extra_cycle2 = self._TXS()
+        elif operation == 60:
+            extra_cycle2 = self._TYA()
+
+        return self._instruction_cycles[opcode] + (extra_cycle1 & extra_cycle2)
+
     def instruction_completed(self) -> bool:
         """
         Returns whether the current instruction has been executed.
         """
         return self._cycles == 0
 
-    def disassemble(self, start_address: int, stop_address: int) -> Dict[str]:
+    def disassemble(self, start_address: int, stop_address: int) -> Dict[int, str]:
         """
         Converts the desired chunk of program memory into human-readable code.
         Used for debugging.
@@ -323,75 +509,76 @@ class CPU:
 
             # Read instruction and get its readable name:
             opcode: int = self._read(address, True)
-            instruction: str = f"${format(address, '04x')}: {self._lookup[opcode].name} "
+            name, _, address_mode, _ = self._lookup[opcode]
+            instruction: str = f"${format(address, '04x')}: {name} "
             operand: int = 0
             address += 1
 
             # Get operands from desired locations and form the instruction:
-            if self._lookup[opcode].address_mode == self._ACC:
+            if address_mode == self._ACC:
                 instruction += "A"
 
-            elif self._lookup[opcode].address_mode == self._IMM:
+            elif address_mode == self._IMM:
                 operand = self._read(address, True)
                 address += 1
                 instruction += f"#{format(operand, '02x')}"
 
-            elif self._lookup[opcode].address_mode == self._ZP0:
+            elif address_mode == self._ZP0:
                 operand = self._read(address, True)
                 address += 1
                 instruction += f"${format(operand, '02x')}"
 
-            elif self._lookup[opcode].address_mode == self._ZPX:
+            elif address_mode == self._ZPX:
                 operand = self._read(address, True)
                 address += 1
                 instruction += f"${format(operand, '02x')}, X"
 
-            elif self._lookup[opcode].address_mode == self._ZPY:
+            elif address_mode == self._ZPY:
                 operand = self._read(address, True)
                 address += 1
                 instruction += f"${format(operand, '02x')}, Y"
 
-            elif self._lookup[opcode].address_mode == self._REL:
+            elif address_mode == self._REL:
                 operand = self._read(address, True)
                 address += 1
                 instruction += f"#{format(operand, '02x')}"
 
-            elif self._lookup[opcode].address_mode == self._ABS:
+            elif address_mode == self._ABS:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
                 address += 1
                 instruction += f"${format(operand, '04x')}"
 
-            elif self._lookup[opcode].address_mode == self._ABX:
+            elif address_mode == self._ABX:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
                 address += 1
                 instruction += f"${format(operand, '04x')}, X"
 
-            elif self._lookup[opcode].address_mode == self._ABY:
+            elif address_mode == self._ABY:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
                 address += 1
                 instruction += f"${format(operand, '04x')}, Y"
 
-            elif self._lookup[opcode].address_mode == self._IND:
+            elif address_mode == self._IND:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
                 address += 1
                 instruction += f"(${format(operand, '04x')})"
 
-            elif self._lookup[opcode].address_mode == self._IZX:
+            elif address_mode == self._IZX:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
                 address += 1
                 instruction += f"(${format(operand, '04x')}), X"
 
-            elif self._lookup[opcode].address_mode == self._IZY:
+            elif address_mode == self._IZY:
                 operand = self._read(address, True)
                 address += 1
                 operand |= self._read(address, True) << 8
@@ -421,8 +608,9 @@ class CPU:
         Address Mode: Immediate
         The instruction expects the next byte to be used as a value.
         """
-        self._address = self.pc_reg
-        self.pc_reg += 1
+        pc = self.pc_reg
+        self._address = pc
+        self.pc_reg = pc + 1
         return 0
 
     def _ZP0(self) -> int:
@@ -430,9 +618,9 @@ class CPU:
         Address Mode: Zero Page
         Allows to absolutely address a location in first 0xFF bytes of address range.
         """
-        self._address = self._read(self.pc_reg)
-        self.pc_reg += 1
-        self._address &= 0x00FF
+        pc = self.pc_reg
+        self._address = self._bus_read(pc)
+        self.pc_reg = pc + 1
         return 0
 
     def _ZPX(self) -> int:
@@ -440,9 +628,9 @@ class CPU:
         Address Mode: Zero Page with X offset
         Same as ZP0, but the contents of the X register is added to the given 8-bit address.
         """
-        self._address = self._read(self.pc_reg) + self.x_reg
-        self.pc_reg += 1
-        self._address &= 0x00FF
+        pc = self.pc_reg
+        self._address = (self._bus_read(pc) + self.x_reg) & 0x00FF
+        self.pc_reg = pc + 1
         return 0
 
     def _ZPY(self) -> int:
@@ -450,9 +638,9 @@ class CPU:
         Address Mode: Zero Page with Y offset
         Same as ZPX, but uses Y register to offset.
         """
-        self._address = self._read(self.pc_reg) + self.y_reg
-        self.pc_reg += 1
-        self._address &= 0x00FF
+        pc = self.pc_reg
+        self._address = (self._bus_read(pc) + self.y_reg) & 0x00FF
+        self.pc_reg = pc + 1
         return 0
 
     def _REL(self) -> int:
@@ -460,27 +648,27 @@ class CPU:
         Address Mode: Relative
         The address must reside within -128 and 127 of the branch instruction.
         """
-        self._address = self._read(self.pc_reg)
-        self.pc_reg += 1
+        # Sign-extend the offset without branching:
+        pc = self.pc_reg + 1
+        offset: int = (self._bus_read(pc - 1) ^ 0x80) - 0x80
+        self.pc_reg = pc
 
-        if self._address & 0x80:
-            self._address |= 0xFF00
+        address = (offset + pc) & 0xFFFF
+        self._address = address
 
-        self._address += self.pc_reg
-
-        if (self._address & 0xFF00) != (self.pc_reg & 0xFF00):
-            return 2
-        return 1
+        # A taken branch takes an extra cycle, and one more if it crosses a page.
+        # The branch moves at most one page, which always flips the lowest bit of the high byte:
+        self._page_cross = ((address ^ pc) >> 8) & 1
+        return 0xFF
 
     def _ABS(self) -> int:
         """
         Address Mode: Absolute
         A full 16-bit address is loaded and used.
         """
-        self._address = self._read(self.pc_reg)
-        self.pc_reg += 1
-        self._address |= self._read(self.pc_reg) << 8
-        self.pc_reg += 1
+        pc = self.pc_reg
+        self._address = self._bus_read16(pc)
+        self.pc_reg = pc + 2
         return 0
 
     def _ABX(self) -> int:
@@ -488,48 +676,39 @@ class CPU:
         Address Mode: Absolute with X offset
         Same as ABS, but the contents of the X register is added to the given 16-bit address.
         """
-        self._address = self._read(self.pc_reg)
-        self.pc_reg += 1
-        self._address |= self._read(self.pc_reg) << 8
-        self.pc_reg += 1
+        pc = self.pc_reg
+        base = self._bus_read16(pc)
+        self.pc_reg = pc + 2
+        self._address = base + self.x_reg
 
-        h = self._address & 0xFF00
-        self._address += self.x_reg
-
-        if (self._address & 0xFF00) != h:
-            return 1
-        return 0
+        # Crossing a page carries into the high byte, flipping its lowest bit:
+        return ((self._address ^ base) >> 8) & 1
 
     def _ABY(self) -> int:
         """
         Address Mode: Absolute with Y offset
         Same as ABX, but uses Y register to offset.
         """
-        self._address = self._read(self.pc_reg)
-        self.pc_reg += 1
-        self._address |= self._read(self.pc_reg) << 8
-        self.pc_reg += 1
-
-        h = self._address & 0xFF00
-        self._address += self.y_reg
+        pc = self.pc_reg
+        base = self._bus_read16(pc)
+        self.pc_reg = pc + 2
+        self._address = base + self.y_reg
 
-        if (self._address & 0xFF00) != h:
-            return 1
-        return 0
+        # Crossing a page carries into the high byte, flipping its lowest bit:
+        return ((self._address ^ base) >> 8) & 1
 
     def _IND(self) -> int:
         """
         Address mode: Indirect
         The supplied 16-bit address is read to get the actual 16-bit address.
         """
-        ptr = self._read(self.pc_reg)
-        self.pc_reg += 1
-        ptr |= self._read(self.pc_reg) << 8
-        self.pc_reg += 1
+        pc = self.pc_reg
+        ptr = self._bus_read16(pc)
+        self.pc_reg = pc + 2
 
-        self._address = self._read(ptr)
-        self._address |= (self._read(ptr & 0xFF00) if (ptr & 0x00FF) == 0x00FF else
-                          self._read(ptr + 1)) << 8
+        self._address = self._bus_read(ptr)
+        self._address |= (self._bus_read(ptr & 0xFF00) if (ptr & 0x00FF) == 0x00FF else
+                          self._bus_read(ptr + 1)) << 8
         return 0
 
     def _IZX(self) -> int:
@@ -538,11 +717,12 @@ class CPU:
         The supplied 8-bit address is offset by X register to index a location in page 0x00.
         The actual 16-bit address is read from this location.
         """
-        ptr = self._read(self.pc_reg) + self.x_reg
-        self.pc_reg += 1
+        pc = self.pc_reg
+        ptr = self._bus_read(pc) + self.x_reg
+        self.pc_reg = pc + 1
 
-        self._address = self._read(ptr & 0x00FF)
-        self._address |= self._read((ptr + 1) & 0x00FF) << 8
+        # The pointer lies in the zero page, which is always in the system RAM:
+        self._address = self._ram[ptr & 0x00FF] | (self._ram[(ptr + 1) & 0x00FF] << 8)
         return 0
 
     def _IZY(self) -> int:
@@ -551,18 +731,16 @@ class CPU:
         The supplied 8-bit address indexes a location in page 0x00.
         The actual 16-bit address is read and Y register is added to it to offset it.
         """
-        ptr = self._read(self.pc_reg)
-        self.pc_reg += 1
-
-        self._address = self._read(ptr & 0x00FF)
-        self._address |= self._read((ptr + 1) & 0x00FF) << 8
+        pc = self.pc_reg
+        ptr = self._bus_read(pc)
+        self.pc_reg = pc + 1
 
-        h = self._address & 0xFF00
-        self._address += self.y_reg
+        # The pointer lies in the zero page, which is always in the system RAM:
+        base = self._ram[ptr] | (self._ram[(ptr + 1) & 0x00FF] << 8)
+        self._address = base + self.y_reg
 
-        if (self._address & 0xFF00) != h:
-            return 1
-        return 0
+        # Crossing a page carries into the high byte, flipping its lowest bit:
+        return ((self._address ^ base) >> 8) & 1
 
     def _ADC(self) -> int:
         """
@@ -571,13 +749,9 @@ class CPU:
         Flags Out:   C, Z, V, N
         """
         m = self._read(self._address)
-        temp = self.a_reg + m + self._get_flag(CPU.FLAGS.C)
-        self._set_flag(CPU.FLAGS.C, temp > 0xFF)
-        self._set_flag(CPU.FLAGS.V, ((~(self.a_reg ^ m) & (self.a_reg ^ temp)) & 0x0080) > 0)
-
-        self.a_reg = temp & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        i = ((self.status_reg & FLAG_C) << 16) | (self.a_reg << 8) | m
+        self.a_reg = _ADD_RESULT[i]
+        self.status_reg = (self.status_reg & _ADD_FLAGS_CLEAR) | _ADD_FLAGS[i]
         return 1
 
     def _AND(self) -> int:
@@ -586,31 +760,36 @@ class CPU:
         Function:    A = A & M
         Flags Out:   Z, N
         """
-        self.a_reg &= self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self.a_reg & self._read(self._address)
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
-    def _ASL(self) -> int:
+    def _ASL_A(self) -> int:
         """
-        Instruction: Arithmetic Shift Left
-        Function:    A = A * 2, M = M * 2
+        Instruction: Arithmetic Shift Left (accumulator)
+        Function:    A = A * 2
         Flags Out:   C, Z, N
         """
-        a_mode = self._lookup[self._opcode].address_mode == self._ACC
-        m = self.a_reg if a_mode else self._read(self._address)
+        temp = self.a_reg << 1
+        m = temp & 0x00FF
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp >> 8) | _ZN[m]
 
-        m <<= 1
-        self._set_flag(CPU.FLAGS.C, (m & 0xFF00) > 0)
+        self.a_reg = m
+        return 0
 
-        m &= 0x00FF
-        self._set_flag(CPU.FLAGS.Z, m == 0x00)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+    def _ASL_M(self) -> int:
+        """
+        Instruction: Arithmetic Shift Left (memory)
+        Function:    M = M * 2
+        Flags Out:   C, Z, N
+        """
+        address = self._address
+        temp = self._read(address) << 1
+        m = temp & 0x00FF
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp >> 8) | _ZN[m]
 
-        if a_mode:
-            self.a_reg = m
-        else:
-            self._write(self._address, m)
+        self._write(address, m)
         return 0
 
     def _BCC(self) -> int:
@@ -618,9 +797,9 @@ class CPU:
         Instruction: Branch if Carry Clear
         Function:    PC = address <- C == 0
         """
-        if not self._get_flag(CPU.FLAGS.C):
+        if not self.status_reg & FLAG_C:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BCS(self) -> int:
@@ -628,9 +807,9 @@ class CPU:
         Instruction: Branch if Carry Set
         Function:    PC = address <- C == 1
         """
-        if self._get_flag(CPU.FLAGS.C):
+        if self.status_reg & FLAG_C:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BEQ(self) -> int:
@@ -638,9 +817,9 @@ class CPU:
         Instruction: Branch if Equal
         Function:    PC = address <- Z == 1
         """
-        if self._get_flag(CPU.FLAGS.Z):
+        if self.status_reg & FLAG_Z:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BIT(self) -> int:
@@ -650,9 +829,8 @@ class CPU:
         Flags Out:   N, V, Z
         """
         m = self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, (self.a_reg & m) == 0x00)
-        self._set_flag(CPU.FLAGS.V, (m & 0x40) > 0)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+        self.status_reg = ((self.status_reg & _BIT_FLAGS_CLEAR) | (m & (FLAG_V | FLAG_N)) |
+                           (_ZN[self.a_reg & m] & FLAG_Z))
         return 0
 
     def _BMI(self) -> int:
@@ -660,9 +838,9 @@ class CPU:
         Instruction: Branch if Negative
         Function:    PC = address <- N == 1
         """
-        if self._get_flag(CPU.FLAGS.N):
+        if self.status_reg & FLAG_N:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BNE(self) -> int:
@@ -670,9 +848,9 @@ class CPU:
         Instruction: Branch if Not Equal
         Function:    PC = address <- Z == 0
         """
-        if not self._get_flag(CPU.FLAGS.Z):
+        if not self.status_reg & FLAG_Z:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BPL(self) -> int:
@@ -680,9 +858,9 @@ class CPU:
         Instruction: Branch if Positive
         Function:    PC = address <- N == 0
         """
-        if not self._get_flag(CPU.FLAGS.N):
+        if not self.status_reg & FLAG_N:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BRK(self) -> int:
@@ -693,17 +871,13 @@ class CPU:
         """
         self.pc_reg += 1
 
-        self._write(0x0100 + self.sp_reg, (self.pc_reg >> 8) & 0x00FF)
-        self.sp_reg -= 1
-        self._write(0x0100 + self.sp_reg, self.pc_reg & 0x00FF)
-        self.sp_reg -= 1
+        self._stack_push((self.pc_reg >> 8) & 0x00FF)
+        self._stack_push(self.pc_reg & 0x00FF)
 
-        self._set_flag(CPU.FLAGS.B, True)
-        self._write(0x0100 + self.sp_reg, self.status_reg)
-        self.sp_reg -= 1
+        self.status_reg |= FLAG_B
+        self._stack_push(self.status_reg)
 
-        self.pc_reg = self._read(0xFFFE)
-        self.pc_reg |= self._read(0xFFFF) << 8
+        self.pc_reg = self._bus_read16(0xFFFE)
         return 0
 
     def _BVC(self) -> int:
@@ -711,9 +885,9 @@ class CPU:
         Instruction: Branch if Overflow Clear
         Function:    PC = address <- V == 0
         """
-        if not self._get_flag(CPU.FLAGS.V):
+        if not self.status_reg & FLAG_V:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _BVS(self) -> int:
@@ -721,9 +895,9 @@ class CPU:
         Instruction: Branch if Overflow Set
         Function:    PC = address <- V == 1
         """
-        if self._get_flag(CPU.FLAGS.V):
+        if self.status_reg & FLAG_V:
             self.pc_reg = self._address
-            return 2
+            return 1 + self._page_cross
         return 0
 
     def _CLC(self) -> int:
@@ -732,7 +906,7 @@ class CPU:
         Function:    C = 0
         Flags out:   C
         """
-        self._set_flag(CPU.FLAGS.C, False)
+        self.status_reg &= ~FLAG_C
         return 0
 
     def _CLD(self) -> int:
@@ -741,7 +915,7 @@ class CPU:
         Function:    D = 0
         Flags out:   D
         """
-        self._set_flag(CPU.FLAGS.D, False)
+        self.status_reg &= ~FLAG_D
         return 0
 
     def _CLI(self) -> int:
@@ -750,7 +924,7 @@ class CPU:
         Function:    I = 0
         Flags out:   I
         """
-        self._set_flag(CPU.FLAGS.I, False)
+        self.status_reg &= ~FLAG_I
         return 0
 
     def _CLV(self) -> int:
@@ -759,7 +933,7 @@ class CPU:
         Function:    V = 0
         Flags out:   V
         """
-        self._set_flag(CPU.FLAGS.V, False)
+        self.status_reg &= ~FLAG_V
         return 0
 
     def _CMP(self) -> int:
@@ -768,11 +942,7 @@ class CPU:
         Function:    Z <- (A - M) == 0
         Flags Out:   C, Z, N
         """
-        m = self._read(self._address)
-        temp = (self.a_reg - m) & 0x00FF
-        self._set_flag(CPU.FLAGS.C, self.a_reg >= m)
-        self._set_flag(CPU.FLAGS.Z, temp == 0x00)
-        self._set_flag(CPU.FLAGS.N, (temp & 0x80) > 0)
+        self._compare(self.a_reg)
         return 1
 
     def _CPX(self) -> int:
@@ -781,11 +951,7 @@ class CPU:
         Function:    Z <- (X - M) == 0
         Flags Out:   C, Z, N
         """
-        m = self._read(self._address)
-        temp = (self.x_reg - m) & 0x00FF
-        self._set_flag(CPU.FLAGS.C, self.x_reg >= m)
-        self._set_flag(CPU.FLAGS.Z, temp == 0x00)
-        self._set_flag(CPU.FLAGS.N, (temp & 0x80) > 0)
+        self._compare(self.x_reg)
         return 0
 
     def _CPY(self) -> int:
@@ -794,11 +960,7 @@ class CPU:
         Function:    Z <- (Y - M) == 0
         Flags Out:   C, Z, N
         """
-        m = self._read(self._address)
-        temp = (self.y_reg - m) & 0x00FF
-        self._set_flag(CPU.FLAGS.C, self.y_reg >= m)
-        self._set_flag(CPU.FLAGS.Z, temp == 0x00)
-        self._set_flag(CPU.FLAGS.N, (temp & 0x80) > 0)
+        self._compare(self.y_reg)
         return 0
 
     def _DEC(self) -> int:
@@ -807,10 +969,18 @@ class CPU:
         Function:    M = M - 1
         Flags Out:   Z, N
         """
-        m = (self._read(self._address) - 1) & 0x00FF
-        self._write(self._address, m)
-        self._set_flag(CPU.FLAGS.Z, m == 0x00)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+        address = self._address
+
+        # Modify a system RAM byte in place:
+        if address < 0x2000:
+            ram = self._ram
+            address &= 0x07FF
+            m = (ram[address] - 1) & 0x00FF
+            ram[address] = m
+        else:
+            m = (self._bus_read(address) - 1) & 0x00FF
+            self._bus_write(address, m)
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[m]
         return 0
 
     def _DEX(self) -> int:
@@ -819,9 +989,9 @@ class CPU:
         Function:    X = X - 1
         Flags Out:   Z, N
         """
-        self.x_reg = (self.x_reg - 1) & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.x_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.x_reg & 0x80) > 0)
+        temp = (self.x_reg - 1) & 0x00FF
+        self.x_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _DEY(self) -> int:
@@ -830,9 +1000,9 @@ class CPU:
         Function:    Y = Y - 1
         Flags Out:   Z, N
         """
-        self.y_reg = (self.y_reg - 1) & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.y_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.y_reg & 0x80) > 0)
+        temp = (self.y_reg - 1) & 0x00FF
+        self.y_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _EOR(self) -> int:
@@ -841,9 +1011,9 @@ class CPU:
         Function:    A = A ^ M
         Flags Out:   Z, N
         """
-        self.a_reg ^= self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self.a_reg ^ self._read(self._address)
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
     def _INC(self) -> int:
@@ -852,10 +1022,18 @@ class CPU:
         Function:    M = M + 1
         Flags Out:   Z, N
         """
-        m = (self._read(self._address) + 1) & 0x00FF
-        self._write(self._address, m)
-        self._set_flag(CPU.FLAGS.Z, m == 0x00)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+        address = self._address
+
+        # Modify a system RAM byte in place:
+        if address < 0x2000:
+            ram = self._ram
+            address &= 0x07FF
+            m = (ram[address] + 1) & 0x00FF
+            ram[address] = m
+        else:
+            m = (self._bus_read(address) + 1) & 0x00FF
+            self._bus_write(address, m)
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[m]
         return 0
 
     def _INX(self) -> int:
@@ -864,9 +1042,9 @@ class CPU:
         Function:    X = X + 1
         Flags Out:   Z, N
         """
-        self.x_reg = (self.x_reg + 1) & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.x_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.x_reg & 0x80) > 0)
+        temp = (self.x_reg + 1) & 0x00FF
+        self.x_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _INY(self) -> int:
@@ -875,9 +1053,9 @@ class CPU:
         Function:    Y = Y + 1
         Flags Out:   Z, N
         """
-        self.y_reg = (self.y_reg + 1) & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.y_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.y_reg & 0x80) > 0)
+        temp = (self.y_reg + 1) & 0x00FF
+        self.y_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _JMP(self) -> int:
@@ -893,12 +1071,13 @@ class CPU:
         Instruction: Jump to a Subroutine
         Function:    PC -> Stack, PC = address
         """
-        self.pc_reg -= 1
+        pc = self.pc_reg - 1
+        sp = self.sp_reg
+        ram = self._ram
 
-        self._write(0x0100 + self.sp_reg, (self.pc_reg >> 8) & 0x00FF)
-        self.sp_reg -= 1
-        self._write(0x0100 + self.sp_reg, self.pc_reg & 0x00FF)
-        self.sp_reg -= 1
+        ram[0x0100 + sp] = (pc >> 8) & 0x00FF
+        ram[0x0100 + ((sp - 1) & 0x00FF)] = pc & 0x00FF
+        self.sp_reg = (sp - 2) & 0x00FF
 
         self.pc_reg = self._address
         return 0
@@ -909,9 +1088,9 @@ class CPU:
         Function:    A = M
         Flags Out:   Z, N
         """
-        self.a_reg = self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self._read(self._address)
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
     def _LDX(self) -> int:
@@ -920,9 +1099,9 @@ class CPU:
         Function:    X = M
         Flags Out:   Z, N
         """
-        self.x_reg = self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.x_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.x_reg & 0x80) > 0)
+        temp = self._read(self._address)
+        self.x_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
     def _LDY(self) -> int:
@@ -931,29 +1110,36 @@ class CPU:
         Function:    Y = M
         Flags Out:   Z, N
         """
-        self.y_reg = self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.y_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.y_reg & 0x80) > 0)
+        temp = self._read(self._address)
+        self.y_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
-    def _LSR(self) -> int:
+    def _LSR_A(self) -> int:
         """
-        Instruction: Logical Shift Right
-        Function:    A = A / 2, M = M / 2
+        Instruction: Logical Shift Right (accumulator)
+        Function:    A = A / 2
         Flags Out:   C, Z, N
         """
-        a_mode = self._lookup[self._opcode].address_mode == self._ACC
-        m = self.a_reg if a_mode else self._read(self._address)
-        self._set_flag(CPU.FLAGS.C, (m & 0x0001) > 0)
+        temp = self.a_reg
+        m = temp >> 1
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp & FLAG_C) | _ZN[m]
 
-        m = (m >> 1) & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, m == 0x00)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+        self.a_reg = m
+        return 0
 
-        if a_mode:
-            self.a_reg = m
-        else:
-            self._write(self._address, m)
+    def _LSR_M(self) -> int:
+        """
+        Instruction: Logical Shift Right (memory)
+        Function:    M = M / 2
+        Flags Out:   C, Z, N
+        """
+        address = self._address
+        temp = self._read(address)
+        m = temp >> 1
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp & FLAG_C) | _ZN[m]
+
+        self._write(address, m)
         return 0
 
     def _NOP(self) -> int:
@@ -971,9 +1157,9 @@ class CPU:
         Function:    A = A | M
         Flags Out:   Z, N
         """
-        self.a_reg |= self._read(self._address)
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self.a_reg | self._read(self._address)
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 1
 
     def _PHA(self) -> int:
@@ -981,8 +1167,9 @@ class CPU:
         Instruction: Push Accumulator to Stack
         Function:    A -> Stack
         """
-        self._write(0x0100 + self.sp_reg, self.a_reg)
-        self.sp_reg -= 1
+        sp = self.sp_reg
+        self._ram[0x0100 + sp] = self.a_reg
+        self.sp_reg = (sp - 1) & 0x00FF
         return 0
 
     def _PHP(self) -> int:
@@ -990,8 +1177,9 @@ class CPU:
         Instruction: Push Status Register to Stack
         Function:    Status -> Stack
         """
-        self._write(0x0100 + self.sp_reg, self.status_reg)
-        self.sp_reg -= 1
+        sp = self.sp_reg
+        self._ram[0x0100 + sp] = self.status_reg
+        self.sp_reg = (sp - 1) & 0x00FF
         return 0
 
     def _PLA(self) -> int:
@@ -1000,10 +1188,12 @@ class CPU:
         Function:    A <- Stack
         Flags Out:   Z, N
         """
-        self.sp_reg += 1
-        self.a_reg = self._read(0x0100 + self.sp_reg)
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        sp = (self.sp_reg + 1) & 0x00FF
+        self.sp_reg = sp
+
+        m = self._ram[0x0100 + sp]
+        self.a_reg = m
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[m]
         return 0
 
     def _PLP(self) -> int:
@@ -1011,50 +1201,59 @@ class CPU:
         Instruction: Pop Status Register off Stack
         Function:    Status <- Stack
         """
-        self.sp_reg += 1
-        self.status_reg = self._read(0x0100 + self.sp_reg)
+        sp = (self.sp_reg + 1) & 0x00FF
+        self.sp_reg = sp
+        self.status_reg = self._ram[0x0100 + sp]
         return 0
 
-    def _ROL(self) -> int:
+    def _ROL_A(self) -> int:
         """
-        Instruction: Rotate Left
+        Instruction: Rotate Left (accumulator)
         Flags Out:   C, Z, N
         """
-        a_mode = self._lookup[self._opcode].address_mode == self._ACC
-        m = self.a_reg if a_mode else self._read(self._address)
+        temp = (self.a_reg << 1) | (self.status_reg & FLAG_C)
+        m = temp & 0x00FF
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp >> 8) | _ZN[m]
 
-        m = (m << 1) | self._get_flag(CPU.FLAGS.C)
-        self._set_flag(CPU.FLAGS.C, (m & 0xFF00) > 0)
+        self.a_reg = m
+        return 0
 
-        m &= 0x00FF
-        self._set_flag(CPU.FLAGS.Z, m == 0x00)
-        self._set_flag(CPU.FLAGS.N, (m & 0x80) > 0)
+    def _ROL_M(self) -> int:
+        """
+        Instruction: Rotate Left (memory)
+        Flags Out:   C, Z, N
+        """
+        address = self._address
+        temp = (self._read(address) << 1) | (self.status_reg & FLAG_C)
+        m = temp & 0x00FF
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (temp >> 8) | _ZN[m]
 
-        if a_mode:
-            self.a_reg = m
-        else:
-            self._write(self._address, m)
+        self._write(address, m)
         return 0
 
-    def _ROR(self) -> int:
+    def _ROR_A(self) -> int:
         """
-        Instruction: Rotate Right
+        Instruction: Rotate Right (accumulator)
         Flags Out:   C, Z, N
         """
-        a_mode = self._lookup[self._opcode].address_mode == self._ACC
-        m = self.a_reg if a_mode else self._read(self._address)
+        m = self.a_reg
+        temp = ((self.status_reg & FLAG_C) << 7) | (m >> 1)
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (m & FLAG_C) | _ZN[temp]
 
-        temp = (self._get_flag(CPU.FLAGS.C) << 7) | (m >> 1)
-        self._set_flag(CPU.FLAGS.C, (m & 0x0001) > 0)
+        self.a_reg = temp
+        return 0
 
-        temp &= 0x00FF
-        self._set_flag(CPU.FLAGS.Z, temp == 0x00)
-        self._set_flag(CPU.FLAGS.N, (temp & 0x80) > 0)
+    def _ROR_M(self) -> int:
+        """
+        Instruction: Rotate Right (memory)
+        Flags Out:   C, Z, N
+        """
+        address = self._address
+        m = self._read(address)
+        temp = ((self.status_reg & FLAG_C) << 7) | (m >> 1)
+        self.status_reg = (self.status_reg & _SHIFT_FLAGS_CLEAR) | (m & FLAG_C) | _ZN[temp]
 
-        if a_mode:
-            self.a_reg = temp
-        else:
-            self._write(self._address, temp)
+        self._write(address, temp)
         return 0
 
     def _RTI(self) -> int:
@@ -1063,12 +1262,12 @@ class CPU:
         Function:    Status <- Stack, PC <- Stack
         Flags Out:   All
         """
-        self.sp_reg += 1
-        self.status_reg = self._read(0x0100 + self.sp_reg)
-        self.sp_reg += 1
-        self.pc_reg = self._read(0x0100 + self.sp_reg)
-        self.sp_reg += 1
-        self.pc_reg |= self._read(0x0100 + self.sp_reg) << 8
+        sp = self.sp_reg
+        ram = self._ram
+
+        self.status_reg = ram[0x0100 + ((sp + 1) & 0x00FF)]
+        self.pc_reg = ram[0x0100 + ((sp + 2) & 0x00FF)] | (ram[0x0100 + ((sp + 3) & 0x00FF)] << 8)
+        self.sp_reg = (sp + 3) & 0x00FF
         return 0
 
     def _RTS(self) -> int:
@@ -1076,11 +1275,11 @@ class CPU:
         Instruction: Return from Subroutine
         Function:    PC <- Stack
         """
-        self.sp_reg += 1
-        self.pc_reg = self._read(0x0100 + self.sp_reg)
-        self.sp_reg += 1
-        self.pc_reg |= self._read(0x0100 + self.sp_reg) << 8
-        self.pc_reg += 1
+        sp = self.sp_reg
+        ram = self._ram
+
+        self.pc_reg = (ram[0x0100 + ((sp + 1) & 0x00FF)] | (ram[0x0100 + ((sp + 2) & 0x00FF)] << 8)) + 1
+        self.sp_reg = (sp + 2) & 0x00FF
         return 0
 
     def _SBC(self) -> int:
@@ -1089,14 +1288,11 @@ class CPU:
         Function:    A = A - M - (1 - C)
         Flags Out:   C, Z, V, N
         """
+        # Subtraction is the addition of the inverted operand:
         m = self._read(self._address) ^ 0x00FF
-        temp = self.a_reg + m + self._get_flag(CPU.FLAGS.C)
-        self._set_flag(CPU.FLAGS.C, temp > 0xFF)
-        self._set_flag(CPU.FLAGS.V, ((~(self.a_reg ^ m) & (self.a_reg ^ temp)) & 0x0080) > 0)
-
-        self.a_reg = temp & 0x00FF
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        i = ((self.status_reg & FLAG_C) << 16) | (self.a_reg << 8) | m
+        self.a_reg = _ADD_RESULT[i]
+        self.status_reg = (self.status_reg & _ADD_FLAGS_CLEAR) | _ADD_FLAGS[i]
         return 1
 
     def _SEC(self) -> int:
@@ -1105,7 +1301,7 @@ class CPU:
         Function:    C = 1
         Flags out:   C
         """
-        self._set_flag(CPU.FLAGS.C, True)
+        self.status_reg |= FLAG_C
         return 0
 
     def _SED(self) -> int:
@@ -1114,7 +1310,7 @@ class CPU:
         Function:    D = 1
         Flags out:   D
         """
-        self._set_flag(CPU.FLAGS.D, True)
+        self.status_reg |= FLAG_D
         return 0
 
     def _SEI(self) -> int:
@@ -1123,7 +1319,7 @@ class CPU:
         Function:    I = 1
         Flags out:   I
         """
-        self._set_flag(CPU.FLAGS.I, True)
+        self.status_reg |= FLAG_I
         return 0
 
     def _STA(self) -> int:
@@ -1156,9 +1352,9 @@ class CPU:
         Function:    X = A
         Flags Out:   Z, N
         """
-        self.x_reg = self.a_reg
-        self._set_flag(CPU.FLAGS.Z, self.x_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.x_reg & 0x80) > 0)
+        temp = self.a_reg
+        self.x_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _TAY(self) -> int:
@@ -1167,9 +1363,9 @@ class CPU:
         Function:    Y = A
         Flags Out:   Z, N
         """
-        self.y_reg = self.a_reg
-        self._set_flag(CPU.FLAGS.Z, self.y_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.y_reg & 0x80) > 0)
+        temp = self.a_reg
+        self.y_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _TSX(self) -> int:
@@ -1178,9 +1374,9 @@ class CPU:
         Function:    X = S
         Flags Out:   Z, N
         """
-        self.x_reg = self.sp_reg
-        self._set_flag(CPU.FLAGS.Z, self.x_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.x_reg & 0x80) > 0)
+        temp = self.sp_reg
+        self.x_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _TXA(self) -> int:
@@ -1189,9 +1385,9 @@ class CPU:
         Function:    A = X
         Flags Out:   Z, N
         """
-        self.a_reg = self.x_reg
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self.x_reg
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _TXS(self) -> int:
@@ -1208,9 +1404,9 @@ class CPU:
         Function:    A = Y
         Flags Out:   Z, N
         """
-        self.a_reg = self.y_reg
-        self._set_flag(CPU.FLAGS.Z, self.a_reg == 0x00)
-        self._set_flag(CPU.FLAGS.N, (self.a_reg & 0x80) > 0)
+        temp = self.y_reg
+        self.a_reg = temp
+        self.status_reg = (self.status_reg & _ZN_FLAGS_CLEAR) | _ZN[temp]
         return 0
 
     def _XXX(self) -> int:
@@ -3,6 +3,8 @@ from abc import ABCMeta, abstractmethod
 
 class Mapper(metaclass=ABCMeta):
 
+    __slots__ = ("prg_banks", "chr_banks")
+
     def __init__(self, prg_banks: int, chr_banks: int):
         self.prg_banks: int = prg_banks
         self.chr_banks: int = chr_banks
@@ -3,6 +3,8 @@ from .mapper import Mapper
 
 class Mapper000(Mapper):
 
+    __slots__ = ()
+
     def __init__(self, prg_banks: int, chr_banks: int) -> None:
         super().__init__(prg_banks, chr_banks)
 
@@ -3,9 +3,9 @@ import random
 import pygame as pg
 
 from enum import Enum
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Sequence, Tuple
 
-from .cartridge import Cartridge
+from .cartridge import Cartridge, MIRROR_VERTICAL
 
 
 class PPU:
@@ -14,8 +14,8 @@ class PPU:
     """
 
     __slots__ = ("controller_reg", "mask_reg", "status_reg", "address_reg", "data_reg",
-                 "name_table", "pattern_table", "palette_table", "cart", "frame_complete", "screen", "patterns",
-                 "_cycles", "_scanline", "_clock_count", "_colors")
+                 "name_table", "pattern_table", "palette_table", "cart", "screen", "patterns", "_frame",
+                 "_cycles", "_scanline", "_clock_count", "_name_table_lut")
 
     class CONTROLLER(Enum):
         """
@@ -51,6 +51,29 @@ class PPU:
         SH = 1 << 6  # Sprite 0 hit
         VB = 1 << 7  # Vertical blank
 
+    # 2C02 system palette in RGB, shared by all instances:
+    _colors: Tuple[Tuple[int, int, int], ...] = (
+        ( 84,  84,  84), (  0,  30, 116), (  8,  16, 144), ( 48,   0, 136),
+        ( 68,   0, 100), ( 92,   0,  48), ( 84,   4,   0), ( 60,  24,   0),
+        ( 32,  42,   0), (  8,  58,   0), (  0,  64,   0), (  0,  60,   0),
+        (  0,  50,  60), (  0,   0,   0), (  0,   0,   0), (  0,   0,   0),
+
+        (152, 150, 152), (  8,  76, 196), ( 48,  50, 236), ( 92,  30, 228),
+        (136,  20, 176), (160,  20, 100), (152,  34,  32), (120,  60,   0),
+        ( 84,  90,   0), ( 40, 114,   0), (  8, 124,   0), (  0, 118,  40),
+        (  0, 102, 120), (  0,   0,   0), (  0,   0,   0), (  0,   0,   0),
+
+        (236, 238, 236), ( 76, 154, 236), (120, 124, 236), (176,  98, 236),
+        (228,  84, 236), (236,  88, 180), (236, 106, 100), (212, 136,  32),
+        (160, 170,   0), (116, 196,   0), ( 76, 208,  32), ( 56, 204, 108),
+        ( 56, 180, 204), ( 60,  60,  60), (  0,   0,   0), (  0,   0,   0),
+
+        (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+        (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+        (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
+        (160, 214, 228), (160, 162, 160), (  0,   0,   0), (  0,   0,   0),
+    )
+
     def __init__(self) -> None:
         # PPU internal registers:
         self.controller_reg: int = 0x00
@@ -60,13 +83,14 @@ class PPU:
         self.data_reg: int = 0x00
 
         # PPU bus:
-        self.name_table: List[List[int]] = 2 * [1024 * [0x00]]
+        self.name_table: List[List[int]] = [1024 * [0x00] for _ in range(2)]
         self.pattern_table: List[List[int]] = 2 * [4096 * [0x00]]
         self.palette_table: List[int] = 32 * [0x00]
         self.cart: Optional[Cartridge] = None
 
         # For the purpose of emulation:
-        self.screen: pg.Surface = pg.Surface((341, 261))
+        self._frame: bytearray = bytearray(341 * 261)
+        self.screen: pg.Surface = pg.image.frombuffer(self._frame, (341, 261), "P")
         self.patterns: Tuple[pg.Surface, pg.Surface] = (pg.Surface((128, 128)), pg.Surface((128, 128)))
 
         # Helper variables:
@@ -74,39 +98,11 @@ class PPU:
         self._scanline: int = 0
         self._clock_count: int = 0
 
-        self._colors: Tuple[Tuple[int, int, int], ...] = (
-            ( 84,  84,  84), (  0,  30, 116), (  8,  16, 144), ( 48,   0, 136),
-            ( 68,   0, 100), ( 92,   0,  48), ( 84,   4,   0), ( 60,  24,   0),
-            ( 32,  42,   0), (  8,  58,   0), (  0,  64,   0), (  0,  60,   0),
-            (  0,  50,  60), (  0,   0,   0), (  0,   0,   0), (  0,   0,   0),
-
-            (152, 150, 152), (  8,  76, 196), ( 48,  50, 236), ( 92,  30, 228),
-            (136,  20, 176), (160,  20, 100), (152,  34,  32), (120,  60,   0),
-            ( 84,  90,   0), ( 40, 114,   0), (  8, 124,   0), (  0, 118,  40),
-            (  0, 102, 120), (  0,   0,   0), (  0,   0,   0), (  0,   0,   0),
-
-            (236, 238, 236), ( 76, 154, 236), (120, 124, 236), (176,  98, 236),
-            (228,  84, 236), (236,  88, 180), (236, 106, 100), (212, 136,  32),
-            (160, 170,   0), (116, 196,   0), ( 76, 208,  32), ( 56, 204, 108),
-            ( 56, 180, 204), ( 60,  60,  60), (  0,   0,   0), (  0,   0,   0),
-
-            (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
-            (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
-            (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
-            (160, 214, 228), (160, 162, 160), (  0,   0,   0), (  0,   0,   0),
-        )
-
-    def _get_flag(self, register: str, flag: PPU.CONTROLLER | PPU.MASK | PPU.STATUS) -> bool:
-        """
-        Returns the state of a specific bit of the requested register.
-        """
-        return (getattr(self, register) & flag.value) > 0
+        # Physical nametable selected by each 1 KB quadrant of the nametable address range:
+        self._name_table_lut: Tuple[int, int, int, int] = (0, 0, 1, 1)
 
-    def _set_flag(self, register: str, flag: PPU.CONTROLLER | PPU.MASK | PPU.STATUS, value: bool) -> None:
-        """
-        Sets or resets a specific bit of the requested register.
-        """
-        setattr(self, register, getattr(self, register) ^ (-value ^ getattr(self, register)) & flag.value)
+        # The screen shares memory with the frame buffer of palette indexes:
+        self.screen.set_palette(PPU._colors)
 
     def connect_cartridge(self, cart: Cartridge) -> None:
         """
@@ -114,6 +110,12 @@ class PPU:
         """
         self.cart = cart
 
+        # Precompute nametable mirroring:
+        if cart.mirror == MIRROR_VERTICAL:
+            self._name_table_lut = (0, 1, 0, 1)
+        else:
+            self._name_table_lut = (0, 0, 1, 1)
+
     def reset(self) -> None:
         """
         Forces PPU into known state.
@@ -132,7 +134,8 @@ class PPU:
         Performs one clock cycle's worth of update.
         """
         # Produce some noise:
-        self.screen.set_at((self._cycles - 1, self._scanline), self._colors[random.choice((0x3F, 0x30))])
+        if self._cycles > 0 and self._scanline >= 0:
+            self._frame[self._scanline * 341 + self._cycles - 1] = random.choice((0x3F, 0x30))
 
         self._clock_count += 1
         self._cycles += 1
@@ -144,6 +147,42 @@ class PPU:
             if self._scanline == 261:
                 self._scanline = -1
 
+    def run(self, cycles: int) -> None:
+        """
+        Performs the given number of clock cycles' worth of update in one call.
+        """
+        # Same steps as clock(), with the state and the callables held in locals:
+        choice: Callable[[Sequence[int]], int] = random.choice
+        frame: bytearray = self._frame
+        cycle: int = self._cycles
+        scanline: int = self._scanline
+
+        for _ in range(cycles):
+            # Produce some noise:
+            if cycle > 0 and scanline >= 0:
+                frame[scanline * 341 + cycle - 1] = choice((0x3F, 0x30))
+
+            cycle += 1
+
+            if cycle == 341:
+                cycle = 0
+                scanline += 1
+
+                if scanline == 261:
+                    scanline = -1
+
+        self._cycles = cycle
+        self._scanline = scanline
+        self._clock_count += cycles
+
+    def cycles_to_frame_complete(self) -> int:
+        """
+        Returns the number of clock cycles until the rendering of the next frame is complete.
+        """
+        # Position within the 262 scanlines of 341 cycles, starting at the pre-render scanline:
+        position: int = (self._scanline + 1) * 341 + self._cycles
+        return (261 * 341 + 340 - position - 1) % (262 * 341) + 1
+
     def frame_completed(self) -> bool:
         """
         Returns whether the rendering of the frame is complete.
@@ -185,7 +224,7 @@ class PPU:
         # PPU data port:
         elif address == 0x0007:
             self._write(self.address_reg, data)
-            self.address_reg += 32 if self._get_flag("controller_reg", PPU.CONTROLLER.IM) else 1
+            self.address_reg += 32 if self.controller_reg & PPU.CONTROLLER.IM.value else 1
 
     def read(self, address: int, read_only: bool = False) -> int:
         """
@@ -205,7 +244,7 @@ class PPU:
                 return self.status_reg
 
             temp = (self.status_reg & 0xE0) | (self.data_reg & 0x1F)
-            self._set_flag("status_reg", PPU.STATUS.VB, False)
+            self.status_reg &= ~PPU.STATUS.VB.value
             return temp
 
         # OAM address port:
@@ -230,7 +269,7 @@ class PPU:
             self.data_reg = self._read(self.address_reg)
             if self.address_reg >= 0x3F00:
                 temp = self.data_reg
-            self.address_reg += 32 if self._get_flag("controller_reg", PPU.CONTROLLER.IM) else 1
+            self.address_reg += 32 if self.controller_reg & PPU.CONTROLLER.IM.value else 1
             return temp
 
         return 0x00
@@ -251,21 +290,7 @@ class PPU:
 
         # Nametable:
         elif 0x2000 <= address <= 0x3EFF and self.cart:
-            address &= 0x0FFF
-
-            if self.cart.mirror == Cartridge.MIRROR.HORIZONTAL:
-                if 0x0000 <= address <= 0x07FF:
-                    self.name_table[0][address & 0x03FF] = data
-
-                elif 0x0800 <= address <= 0x0FFF:
-                    self.name_table[1][address & 0x03FF] = data
-
-            elif self.cart.mirror == Cartridge.MIRROR.VERTICAL:
-                if 0x0000 <= address <= 0x03FF or 0x0800 <= address <= 0x0BFF:
-                    self.name_table[0][address & 0x03FF] = data
-
-                elif 0x0400 <= address <= 0x07FF or 0x0C00 <= address <= 0x0FFF:
-                    self.name_table[1][address & 0x03FF] = data
+            self.name_table[self._name_table_lut[(address >> 10) & 0x03]][address & 0x03FF] = data
 
         # Palette RAM indexes:
         elif 0x3F00 <= address <= 0x3FFF:
@@ -292,21 +317,7 @@ class PPU:
 
         # Nametable:
         if 0x2000 <= address <= 0x3EFF and self.cart:
-            address &= 0x0FFF
-
-            if self.cart.mirror == Cartridge.MIRROR.HORIZONTAL:
-                if 0x0000 <= address <= 0x07FF:
-                    return self.name_table[0][address & 0x03FF]
-
-                if 0x0800 <= address <= 0x0FFF:
-                    return self.name_table[1][address & 0x03FF]
-
-            if self.cart.mirror == Cartridge.MIRROR.VERTICAL:
-                if 0x0000 <= address <= 0x03FF or 0x0800 <= address <= 0x0BFF:
-                    return self.name_table[0][address & 0x03FF]
-
-                if 0x0400 <= address <= 0x07FF or 0x0C00 <= address <= 0x0FFF:
-                    return self.name_table[1][address & 0x03FF]
+            return self.name_table[self._name_table_lut[(address >> 10) & 0x03]][address & 0x03FF]
 
         # Palette RAM indexes:
         if 0x3F00 <= address <= 0x3FFF:
@@ -315,6 +326,6 @@ class PPU:
             if address in (0x10, 0x14, 0x18, 0x1C):
                 address &= 0xF
 
-            return self.palette_table[address] & (0x30 if self._get_flag("mask_reg", PPU.MASK.CGS) else 0x3F)
+            return self.palette_table[address] & (0x30 if self.mask_reg & PPU.MASK.CGS.value else 0x3F)
 
         return 0x00
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Import the emulator package the same way main.py does:
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "pynes"))
@@ -0,0 +1,50 @@
+import unittest
+
+from nes.bus import Bus
+
+
+# Enables NMI and polls the vertical blank flag of the PPU status register ($2002) in a loop:
+VBLANK_WAIT = [
+    0xA9, 0x80,        # LDA #$80
+    0x8D, 0x00, 0x20,  # STA $2000
+    0xE8,              # INX
+    0x2C, 0x02, 0x20,  # BIT $2002
+    0x10, 0xFA,        # BPL -6
+    0xC8,              # INY
+    0x4C, 0x05, 0x02,  # JMP $0205
+]
+
+
+def load_program(program: list) -> Bus:
+    """
+    Creates a system without a cartridge, with the program placed in RAM and the program counter at its start.
+    """
+    nes = Bus()
+    nes.ram[0x0200:0x0200 + len(program)] = bytes(program)
+    nes.cpu.pc_reg = 0x0200
+    return nes
+
+
+class TestRunFrame(unittest.TestCase):
+
+    def test_matches_interleaved_clock(self) -> None:
+        # Bus.run_frame runs the CPU and the PPU one after the other, which is only correct while
+        # the PPU neither raises an NMI nor changes its status register within a frame:
+        expected = load_program(VBLANK_WAIT)
+        actual = load_program(VBLANK_WAIT)
+
+        for frame in range(3):
+            expected.clock()
+            while not expected.ppu.frame_completed():
+                expected.clock()
+            actual.run_frame()
+
+            with self.subTest(frame=frame):
+                for name in ("a_reg", "x_reg", "y_reg", "sp_reg", "pc_reg", "status_reg"):
+                    self.assertEqual(getattr(actual.cpu, name), getattr(expected.cpu, name), name)
+                self.assertEqual(actual.ram, expected.ram)
+                self.assertTrue(actual.ppu.frame_completed())
+
+
+if __name__ == "__main__":
+    unittest.main()
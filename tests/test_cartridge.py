@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from nes.cartridge import Cartridge, MIRROR_VERTICAL
+
+
+class TestCartridge(unittest.TestCase):
+
+    def load(self, image: bytes) -> Cartridge:
+        """
+        Loads a cartridge from the given image bytes written to a temporary file.
+        """
+        with tempfile.NamedTemporaryFile(suffix=".nes", delete=False) as f:
+            f.write(image)
+        self.addCleanup(os.remove, f.name)
+        return Cartridge(f.name)
+
+    def test_valid_image(self) -> None:
+        cart = self.load(b"NES\x1a" + bytes([1, 1, 0x01]) + 9 * b"\x00" + 16384 * b"\xEA" + 8192 * b"\x00")
+
+        self.assertTrue(cart.valid_image)
+        self.assertEqual((cart.prg_banks, cart.chr_banks), (1, 1))
+        self.assertEqual(cart.mirror, MIRROR_VERTICAL)
+
+    def test_truncated_header(self) -> None:
+        for image in (b"", b"NES\x1a", b"NES\x1a" + 11 * b"\x00"):
+            with self.subTest(size=len(image)):
+                self.assertFalse(self.load(image).valid_image)
+
+    def test_bad_magic(self) -> None:
+        self.assertFalse(self.load(b"NES\x00" + bytes([1, 1]) + 10 * b"\x00" + 16384 * b"\xEA").valid_image)
+
+    def test_unsupported_mapper(self) -> None:
+        self.assertFalse(self.load(b"NES\x1a" + bytes([1, 1, 0x10]) + 9 * b"\x00" + 24576 * b"\x00").valid_image)
+
+    def test_missing_file(self) -> None:
+        self.assertFalse(Cartridge(os.path.join(tempfile.gettempdir(), "missing.nes")).valid_image)
+
+
+if __name__ == "__main__":
+    unittest.main()
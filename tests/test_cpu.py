@@ -0,0 +1,194 @@
+import random
+import unittest
+
+from typing import Callable, List, Sequence, Tuple
+from unittest import mock
+
+from nes import codegen, cpu as cpu_module
+from nes.bus import Bus
+
+# The flag is a cdef global, out of reach from Python, in the compiled build:
+COMPILED: bool = getattr(cpu_module, "_COMPILED", True)
+
+
+def load_program(program: Sequence[int], address: int = 0x0200) -> Bus:
+    """
+    Creates a system without a cartridge, with the program placed in RAM and the program counter at its start.
+    """
+    nes = Bus()
+    nes.ram[address:address + len(program)] = bytes(program)
+    nes.cpu.pc_reg = address
+    return nes
+
+
+def step(nes: Bus) -> int:
+    """
+    Clocks the CPU through one whole instruction and returns the number of cycles it took.
+    """
+    cycles: int = 1
+    nes.cpu.clock()
+    while not nes.cpu.instruction_completed():
+        nes.cpu.clock()
+        cycles += 1
+    return cycles
+
+
+def run_step(nes: Bus) -> int:
+    """
+    Runs one whole instruction through CPU.run and returns the number of cycles it took.
+    """
+    # Pay the cycles still owed by the previous instruction and one cycle of the next:
+    nes.cpu.run(nes.cpu._cycles + 1)
+    return 1 + nes.cpu._cycles
+
+
+def execute_step(nes: Bus) -> int:
+    """
+    Clocks the CPU through one whole instruction dispatched by the switches of the compiled build.
+    """
+    with mock.patch.object(cpu_module, "_COMPILED", True):
+        return step(nes)
+
+
+def random_system(seed: int) -> Bus:
+    """
+    Creates a system with random RAM contents and registers, running the code found in RAM.
+    """
+    rng = random.Random(seed)
+    nes = Bus()
+    nes.ram[:] = bytes(rng.getrandbits(8) for _ in range(len(nes.ram)))
+
+    cpu = nes.cpu
+    cpu.a_reg, cpu.x_reg, cpu.y_reg, cpu.sp_reg, cpu.status_reg = (rng.getrandbits(8) for _ in range(5))
+    cpu.pc_reg = rng.randrange(0x0800)
+    return nes
+
+
+def trace(nes: Bus, execute: Callable[[Bus], int], instructions: int) -> List[Tuple[int, ...]]:
+    """
+    Executes the given number of instructions and returns the registers and cycles after each of them.
+    """
+    cpu = nes.cpu
+    states: List[Tuple[int, ...]] = []
+    for _ in range(instructions):
+        cycles: int = execute(nes)
+        states.append((cpu.a_reg, cpu.x_reg, cpu.y_reg, cpu.sp_reg, cpu.pc_reg, cpu.status_reg, cycles))
+    return states
+
+
+class TestStack(unittest.TestCase):
+
+    def test_push_wraps_stack_pointer(self) -> None:
+        nes = load_program([0x48])  # PHA
+        nes.cpu.a_reg = 0x42
+        nes.cpu.sp_reg = 0x00
+
+        step(nes)
+
+        self.assertEqual(nes.ram[0x0100], 0x42)
+        self.assertEqual(nes.cpu.sp_reg, 0xFF)
+
+    def test_pull_wraps_stack_pointer(self) -> None:
+        nes = load_program([0x68])  # PLA
+        nes.ram[0x0100] = 0x42
+        nes.cpu.sp_reg = 0xFF
+
+        step(nes)
+
+        self.assertEqual(nes.cpu.a_reg, 0x42)
+        self.assertEqual(nes.cpu.sp_reg, 0x00)
+
+    def test_subroutine_call_wraps_stack_pointer(self) -> None:
+        nes = load_program([0x20, 0x10, 0x02])  # JSR $0210
+        nes.ram[0x0210] = 0x60  # RTS
+        nes.cpu.sp_reg = 0x00
+
+        step(nes)
+
+        self.assertEqual(nes.cpu.pc_reg, 0x0210)
+        self.assertEqual((nes.ram[0x0100], nes.ram[0x01FF]), (0x02, 0x02))
+        self.assertEqual(nes.cpu.sp_reg, 0xFE)
+
+        step(nes)
+
+        self.assertEqual(nes.cpu.pc_reg, 0x0203)
+        self.assertEqual(nes.cpu.sp_reg, 0x00)
+
+    def test_transfer_after_underflow_stores_a_byte(self) -> None:
+        nes = load_program([0x68, 0xBA, 0x86, 0x10])  # PLA; TSX; STX $10
+        nes.cpu.sp_reg = 0xFF
+
+        for _ in range(3):
+            step(nes)
+
+        self.assertEqual(nes.ram[0x0010], 0x00)
+
+
+class TestBranch(unittest.TestCase):
+
+    # (start address, program, expected program counter, expected cycles):
+    cases = {
+        "not taken": (0x0200, [0xF0, 0x10], 0x0202, 2),            # BEQ +16
+        "taken": (0x0200, [0xD0, 0x10], 0x0212, 3),                # BNE +16
+        "taken backwards": (0x0210, [0xD0, 0xFE], 0x0210, 3),      # BNE -2
+        "taken across page": (0x02F0, [0xD0, 0x20], 0x0312, 4),    # BNE +32
+        "taken across 0x0000": (0x0000, [0xD0, 0xFB], 0xFFFD, 4),  # BNE -5
+    }
+
+    def test_cycles_and_target(self) -> None:
+        # The cycles owed by CPU.run can only be read in pure Python:
+        for execute in (step,) if COMPILED else (step, run_step):
+            for name, (address, program, pc, cycles) in self.cases.items():
+                with self.subTest(execute.__name__, case=name):
+                    nes = load_program(program, address)
+
+                    self.assertEqual(execute(nes), cycles)
+                    self.assertEqual(nes.cpu.pc_reg, pc)
+
+
+@unittest.skipIf(COMPILED, "the dispatch paths can only be switched in pure Python")
+class TestDispatch(unittest.TestCase):
+    """
+    The generated handlers used by run(), the methods used by clock() and the switches of _execute()
+    are separate implementations of the instruction set that must stay in agreement.
+    """
+
+    def test_paths_agree(self) -> None:
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                expected = random_system(seed)
+                expected_trace = trace(expected, step, 2000)
+
+                for execute in (run_step, execute_step):
+                    actual = random_system(seed)
+                    for i, state in enumerate(trace(actual, execute, 2000)):
+                        self.assertEqual(state, expected_trace[i], f"{execute.__name__}, instruction {i}")
+                    self.assertEqual(actual.ram, expected.ram, execute.__name__)
+
+                    # CPU.run leaves the cycles still owed by the last instruction out of the clock count:
+                    self.assertEqual(actual.cpu._clock_count + actual.cpu._cycles, expected.cpu._clock_count,
+                                     execute.__name__)
+
+
+@unittest.skipIf(COMPILED, "the generated handlers are only used in pure Python")
+class TestHandlerCache(unittest.TestCase):
+
+    def test_cached_builder_binds_each_cpu(self) -> None:
+        first = random_system(0)
+        hits: int = codegen.compile_builder.cache_info().hits
+        second = random_system(0)
+
+        # The second CPU reuses the compiled builder, but gets its own handlers:
+        self.assertGreater(codegen.compile_builder.cache_info().hits, hits)
+        self.assertIsNot(first.cpu._handlers[0xA9], second.cpu._handlers[0xA9])
+
+        # Interleaved runs must not reach each other's state and must agree with the methods:
+        expected_trace = trace(random_system(0), step, 2000)
+        for i in range(2000):
+            for system in (first, second):
+                self.assertEqual(trace(system, run_step, 1)[0], expected_trace[i], f"instruction {i}")
+        self.assertEqual(first.ram, second.ram)
+
+
+if __name__ == "__main__":
+    unittest.main()